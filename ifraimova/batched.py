@@ -0,0 +1,199 @@
+"""
+Lockstep execution of many independent Dolphin Echolocation swarms.
+
+K swarms of N dolphins are stored as one (K, N, D) array, so AF, PP/Re and
+the position update for all swarms are single vectorized operations. Like
+DolphinEcholocation, each swarm moves and evaluates `update_block` dolphins
+at a time (one by default) and steers later blocks by its best so far, so
+the objective is called once per block on a (K * update_block, D) batch
+and every swarm runs the same algorithm as a single optimizer. Each swarm
+keeps its own best solution and convergence history.
+"""
+
+import time
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from dolphin import SeedLike, make_rng
+from evaluation import as_batch_objective, evaluate_batch
+from kernels import DEFAULT_MEMORY_LIMIT, batched_accumulative_fitness
+
+
+class BatchedDolphinEcholocation:
+
+    def __init__(self,
+                 objective_function: Callable,
+                 dimension: int,
+                 bounds: List[Tuple[float, float]],
+                 n_swarms: int,
+                 population_size: int = 30,
+                 max_iterations: int = 100,
+                 convergence_curve: bool = True,
+                 pp_initial: float = 0.15,
+                 power: float = 0.5,
+                 re_initial: float = None,
+                 af_memory_limit: int = DEFAULT_MEMORY_LIMIT,
+                 update_block: Optional[int] = None,
+                 verbose: bool = True,
+                 seed: SeedLike = None):
+
+        self.objective_function = objective_function
+        self.batch_function = as_batch_objective(objective_function)
+        self.dimension = dimension
+        self.bounds = bounds
+        self.n_swarms = n_swarms
+        self.population_size = population_size
+        self.max_iterations = max_iterations
+        self.convergence_curve = convergence_curve
+        self.pp_initial = pp_initial
+        self.power = power
+        self.af_memory_limit = af_memory_limit
+        self.verbose = verbose
+
+        # As in DolphinEcholocation: None (or 1) is the one-by-one update,
+        # N moves every pod at once from the iteration's starting best.
+        if update_block is not None and update_block < 1:
+            raise ValueError("update_block must be a positive integer or None")
+        self.update_block = min(update_block or 1, population_size)
+
+        self.lower = np.array([bounds[i][0] for i in range(dimension)], dtype=float)
+        self.upper = np.array([bounds[i][1] for i in range(dimension)], dtype=float)
+
+        if re_initial is None:
+            self.re_initial = 0.25 * np.mean(self.upper - self.lower)
+        else:
+            self.re_initial = re_initial
+
+        self.rng = make_rng(seed)
+        shape = (n_swarms, population_size, dimension)
+        self.positions = self.rng.uniform(self.lower, self.upper, shape)
+        self._direction_block = np.empty(shape)
+        self.fitness = np.full((n_swarms, population_size), float('inf'))
+
+        self.best_positions = np.empty((n_swarms, dimension))
+        self.best_fitness = np.full(n_swarms, float('inf'))
+
+        history_shape = (n_swarms, max_iterations + 1) if convergence_curve else (n_swarms, 0)
+        self.convergence_history = np.zeros(history_shape)
+        self.pp_history = np.zeros(history_shape[1])
+        self.cf_history = np.zeros(history_shape)
+
+        self.iteration_count = 0
+        self.function_evaluations = 0
+
+    def calculate_pp(self, iteration: int) -> float:
+        if self.max_iterations <= 1:
+            return 1.0
+        return self.pp_initial + (1 - self.pp_initial) * \
+            (iteration / (self.max_iterations - 1)) ** self.power
+
+    def calculate_re(self, iteration: int) -> float:
+        return self.re_initial * (1 - iteration / self.max_iterations)
+
+    def evaluate_population(self, initial: bool = False):
+        self._evaluate_rows(0, self.population_size, initial)
+
+    def _evaluate_rows(self, start: int, stop: int, initial: bool = False):
+        block = self.positions[:, start:stop]
+        flat = block.reshape(-1, self.dimension)
+        fitness = evaluate_batch(self.batch_function, flat).reshape(self.n_swarms, stop - start)
+        self.fitness[:, start:stop] = fitness
+        self.function_evaluations += flat.shape[0]
+
+        # Same selection as best_index(): NaN is ignored, and a swarm whose
+        # values are all NaN falls back to row 0 without improving its best.
+        valid = np.where(np.isnan(fitness), np.inf, fitness)
+        best_idx = np.argmin(valid, axis=1)
+        swarm_idx = np.arange(self.n_swarms)
+        candidate = valid[swarm_idx, best_idx]
+        # The initial evaluation always sets the best position, so it lies
+        # inside the bounds even when no value is finite.
+        improved = (candidate < self.best_fitness) | initial
+        self.best_fitness[improved] = candidate[improved]
+        self.best_positions[improved] = block[swarm_idx[improved], best_idx[improved]]
+
+    def calculate_accumulative_fitness(self, iteration: int) -> np.ndarray:
+        return batched_accumulative_fitness(self.positions, self.fitness,
+                                            self.calculate_re(iteration), self.af_memory_limit)
+
+    def calculate_convergence_factor(self) -> np.ndarray:
+        distances = np.linalg.norm(self.positions - self.best_positions[:, None, :], axis=2)
+        close_count = np.count_nonzero(distances < self.re_initial * 0.1, axis=1)
+        return (close_count / self.population_size) * 100
+
+    def normalize_af(self, af_values: np.ndarray) -> np.ndarray:
+        # Per swarm, as in DolphinEcholocation: a sum that is not positive
+        # (including NaN from a NaN fitness) falls back to uniform weights.
+        af_sum = np.sum(af_values, axis=1, keepdims=True)
+        valid = af_sum > 0
+        return np.where(valid, af_values / np.where(valid, af_sum, 1.0),
+                        1.0 / self.population_size)
+
+    def update_positions(self, iteration: int, af_normalized: np.ndarray):
+        """Move every swarm's whole pod at once, steered by the current bests."""
+        self._move_rows(self._draw_moves(iteration, af_normalized), 0, self.population_size)
+
+    def _draw_moves(self, iteration: int, af_normalized: np.ndarray) -> tuple:
+        k, n, d = self.positions.shape
+        pp = self.calculate_pp(iteration)
+        random_direction = self.rng.random(out=self._direction_block)
+        random_direction *= 2
+        random_direction -= 1
+        neighbor_idx = self.rng.integers(0, n, (k, n))
+        return pp, self.calculate_re(iteration), (1 - pp) * af_normalized, neighbor_idx
+
+    def _move_rows(self, moves: tuple, start: int, stop: int):
+        pp, re, scale, neighbor_idx = moves
+        rows = slice(start, stop)
+        positions = self.positions
+        current = positions[:, rows]
+
+        global_component = pp * (self.best_positions[:, None, :] - current)
+        local_component = scale[:, rows, None] * re * self._direction_block[:, rows]
+        neighbors = np.take_along_axis(positions, neighbor_idx[:, rows, None], axis=1)
+        social_component = 0.1 * (1 - pp) * (neighbors - current)
+
+        new_positions = current + global_component + local_component + social_component
+        np.clip(new_positions, self.lower, self.upper, out=current)
+
+    def _record_state(self, index: int, pp: float):
+        if self.convergence_curve:
+            self.convergence_history[:, index] = self.best_fitness
+            self.pp_history[index] = pp
+            self.cf_history[:, index] = 0.0 if index == 0 else self.calculate_convergence_factor()
+
+    def optimize(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        start_time = time.time()
+
+        self.evaluate_population(initial=True)
+        self._record_state(0, self.pp_initial)
+
+        for iteration in range(self.max_iterations):
+            self.iteration_count = iteration + 1
+            pp = self.calculate_pp(iteration)
+
+            af_normalized = self.normalize_af(self.calculate_accumulative_fitness(iteration))
+
+            moves = self._draw_moves(iteration, af_normalized)
+            for start in range(0, self.population_size, self.update_block):
+                stop = min(start + self.update_block, self.population_size)
+                self._move_rows(moves, start, stop)
+                self._evaluate_rows(start, stop)
+            self._record_state(iteration + 1, pp)
+
+        execution_time = time.time() - start_time
+
+        if self.verbose:
+            print(f"✓ {self.n_swarms} swarms x {self.population_size} dolphins completed "
+                  f"in {execution_time:.2f} seconds")
+            print(f"✓ Total function evaluations: {self.function_evaluations}")
+            print(f"✓ Best fitness: min {np.min(self.best_fitness):.6e} | "
+                  f"median {np.median(self.best_fitness):.6e} | "
+                  f"max {np.max(self.best_fitness):.6e}")
+
+        return self.best_positions, self.best_fitness, self.convergence_history
+
+    def swarm_result(self, index: int) -> Tuple[np.ndarray, float, np.ndarray]:
+        return (self.best_positions[index], float(self.best_fitness[index]),
+                self.convergence_history[index])
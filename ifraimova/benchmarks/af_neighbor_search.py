@@ -0,0 +1,100 @@
+"""
+Benchmark: brute-force vs spatial-index accumulative fitness.
+
+For every (N, D) pair the effective radius is swept from a large fraction
+of the search space down to a tiny one, mirroring how Re shrinks over a
+run. The crossover is the smallest radius fraction at which the indexed
+search is no longer faster than brute force; below it the index wins.
+
+Usage:
+    python benchmarks/af_neighbor_search.py [--sizes 500 1000 2000] [--dims 2 5 10]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from kernels import accumulative_fitness
+from spatial_index import cKDTree, indexed_accumulative_fitness
+
+
+RADIUS_FRACTIONS = [0.25, 0.1, 0.05, 0.02, 0.01, 0.005]
+
+
+def find_crossover(timings: dict, method: str):
+    """Smallest swept fraction where `method` is at least as slow as brute force, or None."""
+    for fraction in sorted(timings):
+        if timings[fraction][method] >= timings[fraction]['brute']:
+            return fraction
+    return None
+
+
+def time_call(func, repeats: int) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_case(n: int, d: int, fraction: float, methods: list, repeats: int, rng) -> dict:
+    span = 200.0
+    # Points clustered around a few centres, as in the late phase of a run
+    centres = rng.uniform(-span / 2, span / 2, (5, d))
+    positions = centres[rng.integers(0, 5, n)] + rng.normal(0, span * 0.05, (n, d))
+    fitness = rng.uniform(0, 100, n)
+    re = fraction * span
+
+    timings = {'brute': time_call(lambda: accumulative_fitness(positions, fitness, re), repeats)}
+    for method in methods:
+        timings[method] = time_call(
+            lambda: indexed_accumulative_fitness(positions, fitness, re, method), repeats)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 1000, 2000, 4000])
+    parser.add_argument('--dims', type=int, nargs='+', default=[2, 5, 10, 30])
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    methods = ['grid'] + (['kdtree'] if cKDTree is not None else [])
+    rng = np.random.default_rng(args.seed)
+
+    header = f"{'N':>6} {'D':>5} {'Re/span':>8} {'brute (ms)':>11}"
+    for method in methods:
+        header += f" {method + ' (ms)':>12} {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+
+    crossovers = []
+    for n in args.sizes:
+        for d in args.dims:
+            sweep = {}
+            for fraction in RADIUS_FRACTIONS:
+                timings = sweep[fraction] = run_case(n, d, fraction, methods, args.repeats, rng)
+                line = f"{n:>6} {d:>5} {fraction:>8.3f} {timings['brute'] * 1e3:>11.2f}"
+                for method in methods:
+                    speedup = timings['brute'] / timings[method]
+                    line += f" {timings[method] * 1e3:>12.2f} {speedup:>7.2f}x"
+                print(line)
+            crossovers.append((n, d, {method: find_crossover(sweep, method)
+                                      for method in methods}))
+
+    print("\nCrossover (smallest Re/span where the index stops beating brute force):")
+    for n, d, crossover in crossovers:
+        parts = [f"{method}={'no crossover in sweep' if value is None else f'{value:.3f}'}"
+                 for method, value in crossover.items()]
+        print(f"  N={n:<6} D={d:<5} " + "  ".join(parts))
+
+
+if __name__ == "__main__":
+    main()
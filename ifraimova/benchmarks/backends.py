@@ -0,0 +1,88 @@
+"""
+Benchmark: NumPy vs Numba kernel backends.
+
+For every (N, D) pair the accumulative fitness, the vectorized position
+update and a full iteration (iterate()) are timed with both
+backends on identical populations, together with the largest relative
+difference between the AF values. The first Numba call of each kernel
+compiles it and is excluded from the timings.
+
+Usage:
+    python benchmarks/backends.py [--sizes 100 1000 5000] [--dims 2 10 100]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from dolphin import DolphinEcholocation, sphere_function
+from jit_kernels import numba
+
+
+def time_call(func, repeats: int) -> float:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeats, number)) / number
+
+
+def make_pod(n: int, d: int, backend: str, seed: int) -> DolphinEcholocation:
+    de = DolphinEcholocation(sphere_function, d, [(-100, 100)] * d, population_size=n,
+                             max_iterations=10**6, seed=seed, verbose=False, backend=backend)
+    de.tell(sphere_function(de.ask()))
+    return de
+
+
+def run_case(n: int, d: int, repeats: int, seed: int) -> dict:
+    timings, af = {}, {}
+    for backend in ('numpy', 'numba'):
+        de = make_pod(n, d, backend, seed)
+        af[backend] = de.calculate_accumulative_fitness(0)
+        weights = af[backend] / af[backend].sum()
+        de.update_positions(0, weights)
+        snapshot = de.positions.copy()
+
+        def iteration():
+            de.positions[...] = snapshot
+            de.iterate()
+
+        timings[backend] = {
+            'af': time_call(lambda: de.calculate_accumulative_fitness(0), repeats),
+            'update': time_call(lambda: de.update_positions(0, weights), repeats),
+            'iteration': time_call(iteration, repeats)
+        }
+    difference = float(np.max(np.abs(af['numpy'] - af['numba']) / np.abs(af['numpy'])))
+    return {'timings': timings, 'af_rel_difference': difference}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[30, 100, 1000, 5000])
+    parser.add_argument('--dims', type=int, nargs='+', default=[2, 10, 100])
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if numba is None:
+        print("numba is not installed; install it to compare the backends (pip install numba)")
+        return
+
+    print(f"{'N':>6} {'D':>5} {'kernel':<10} {'numpy (ms)':>11} {'numba (ms)':>11} {'speedup':>8}")
+    print("-" * 56)
+    for n in args.sizes:
+        for d in args.dims:
+            case = run_case(n, d, args.repeats, args.seed)
+            for kernel in ('af', 'update', 'iteration'):
+                base = case['timings']['numpy'][kernel]
+                jit = case['timings']['numba'][kernel]
+                print(f"{n:>6} {d:>5} {kernel:<10} {base * 1e3:>11.3f} {jit * 1e3:>11.3f} "
+                      f"{base / jit:>7.2f}x")
+            print(f"{'':>13}max relative AF difference: {case['af_rel_difference']:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: island model scaling and solution quality.
+
+Scaling: every island does the same amount of work, so with enough cores
+the wall time should stay flat as islands are added (throughput grows
+linearly). Quality: the island model is compared with a single pod holding
+the same total number of dolphins on a multimodal function.
+
+Usage:
+    python benchmarks/island_scaling.py [--islands 1 2 4 8] [--function rastrigin] [--seeds 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from dolphin import DolphinEcholocation
+from islands import IslandModel
+from multi_seed import BENCHMARKS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--islands', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--function', default='rastrigin', choices=list(BENCHMARKS))
+    parser.add_argument('--dimension', type=int, default=30)
+    parser.add_argument('--population', type=int, default=200)
+    parser.add_argument('--iterations', type=int, default=100)
+    parser.add_argument('--interval', type=int, default=10)
+    parser.add_argument('--migrants', type=int, default=2)
+    parser.add_argument('--topology', default='ring', choices=['ring', 'full'])
+    parser.add_argument('--seeds', type=int, default=3)
+    args = parser.parse_args()
+
+    benchmark = BENCHMARKS[args.function]
+    bounds = [benchmark['bounds']] * args.dimension
+    print(f"CPUs: {os.cpu_count()}")
+    print(f"{'Islands':>7} {'wall (s)':>9} {'evals/s':>11} {'efficiency':>10} "
+          f"{'islands best':>13} {'single pod best':>16}")
+    print("-" * 72)
+
+    base_rate = None
+    for n_islands in args.islands:
+        island_best, single_best, walls, rates = [], [], [], []
+        for seed in range(args.seeds):
+            model = IslandModel(benchmark['function'], args.dimension, bounds,
+                                n_islands=n_islands, migration_interval=args.interval,
+                                n_migrants=args.migrants, topology=args.topology, seed=seed,
+                                verbose=False, population_size=args.population,
+                                max_iterations=args.iterations)
+            start = time.perf_counter()
+            model.optimize()
+            walls.append(time.perf_counter() - start)
+            rates.append(model.function_evaluations / walls[-1])
+            island_best.append(model.best_fitness)
+
+            single = DolphinEcholocation(benchmark['function'], args.dimension, bounds,
+                                         population_size=args.population * n_islands,
+                                         max_iterations=args.iterations, seed=seed,
+                                         verbose=False)
+            single_best.append(single.optimize()[1])
+
+        rate = float(np.median(rates))
+        base_rate = base_rate or rate / args.islands[0]
+        efficiency = rate / (base_rate * n_islands)
+        print(f"{n_islands:>7} {np.median(walls):>9.2f} {rate:>11.0f} {efficiency:>9.0%} "
+              f"{np.median(island_best):>13.4e} {np.median(single_best):>16.4e}")
+
+
+if __name__ == "__main__":
+    main()
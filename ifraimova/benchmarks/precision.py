@@ -0,0 +1,86 @@
+"""
+Benchmark: float64 vs float32 working precision.
+
+For every (function, N, D) cell both dtypes run the same seeds with
+position history enabled. Reported per dtype: median wall time per
+iteration, peak traced memory of the whole run, the bytes held by the
+population state (positions, random-direction block and position history)
+and the median final best fitness over the seeds.
+
+Usage:
+    python benchmarks/precision.py [--sizes 100 1000 5000] [--dims 10 100] [--seeds 5]
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from dolphin import DolphinEcholocation
+from multi_seed import BENCHMARKS
+from suite import IterationTimer
+
+
+DTYPES = (np.float64, np.float32)
+
+
+def run_case(function_name: str, n: int, d: int, dtype, iterations: int, seeds: int) -> dict:
+    benchmark = BENCHMARKS[function_name]
+    per_iteration, best, peaks = [], [], []
+    for seed in range(seeds):
+        timer = IterationTimer()
+        tracemalloc.start()
+        de = DolphinEcholocation(benchmark['function'], d, [benchmark['bounds']] * d,
+                                 population_size=n, max_iterations=iterations, seed=seed,
+                                 verbose=False, track_positions=True, dtype=dtype,
+                                 callbacks=[timer])
+        de.optimize()
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        per_iteration.extend(np.diff(timer.stamps))
+        best.append(de.best_fitness)
+
+    state_bytes = de.positions.nbytes + de._direction_block.nbytes + de.position_history.nbytes
+    return {
+        'time_per_iteration': float(np.median(per_iteration)),
+        'peak_memory_bytes': int(max(peaks)),
+        'state_bytes': int(state_bytes),
+        'median_best_fitness': float(np.median(best))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--functions', nargs='+', default=['sphere', 'rastrigin'],
+                        choices=list(BENCHMARKS))
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000])
+    parser.add_argument('--dims', type=int, nargs='+', default=[10, 100])
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--seeds', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'Function':<11} {'N':>6} {'D':>5} {'dtype':<8} {'ms/iter':>9} {'peak MiB':>9} "
+          f"{'state MiB':>10} {'median best':>12}")
+    print("-" * 78)
+    for function_name in args.functions:
+        for n in args.sizes:
+            for d in args.dims:
+                rows = {}
+                for dtype in DTYPES:
+                    rows[dtype] = run_case(function_name, n, d, dtype, args.iterations, args.seeds)
+                    row = rows[dtype]
+                    print(f"{function_name:<11} {n:>6} {d:>5} {np.dtype(dtype).name:<8} "
+                          f"{row['time_per_iteration'] * 1e3:>9.2f} "
+                          f"{row['peak_memory_bytes'] / 2**20:>9.1f} "
+                          f"{row['state_bytes'] / 2**20:>10.2f} "
+                          f"{row['median_best_fitness']:>12.4e}")
+                speedup = rows[np.float64]['time_per_iteration'] / rows[np.float32]['time_per_iteration']
+                print(f"{'':>24}float32 speedup {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
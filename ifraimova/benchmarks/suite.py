@@ -0,0 +1,251 @@
+"""
+Performance benchmark suite for the Dolphin Echolocation optimizer.
+
+`run` measures, for every (function, N, D) cell of the grid, the wall time
+per iteration, objective evaluations per second and the peak traced memory
+of a short optimization. It also times the hot kernels in isolation on an
+initialized pod. Results are written as JSON.
+
+`compare` matches two result files cell by cell and flags every metric that
+got worse by more than the threshold; the exit status is 1 when any
+regression is found, so it can gate CI.
+
+The default grid (N up to 10k, D up to 1000) takes a long time; --quick runs
+a small subset.
+
+Usage:
+    python benchmarks/suite.py run --output results.json [--quick]
+    python benchmarks/suite.py run --sizes 30 1000 --dims 2 100 --functions sphere
+    python benchmarks/suite.py compare baseline.json results.json [--threshold 0.1]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from callbacks import Callback
+from dolphin import DolphinEcholocation, sphere_function
+from multi_seed import BENCHMARKS
+
+
+DEFAULT_SIZES = [30, 100, 1000, 10000]
+DEFAULT_DIMS = [2, 10, 100, 1000]
+QUICK_SIZES = [30, 300]
+QUICK_DIMS = [2, 30]
+
+KERNELS = ['calculate_accumulative_fitness', 'update_positions', 'update_dolphin_position',
+           'calculate_convergence_factor', 'Dolphin.update_position']
+
+# Metrics compared by `compare`; True when a larger value is better.
+METRICS = {
+    'time_per_iteration': False,
+    'evaluations_per_second': True,
+    'peak_memory_bytes': False,
+    'seconds': False,
+}
+
+
+class IterationTimer(Callback):
+
+    def __init__(self):
+        self.stamps = []
+
+    def on_iteration_end(self, optimizer, iteration: int, pp: float):
+        self.stamps.append(time.perf_counter())
+
+
+def make_optimizer(function_name: str, n: int, d: int, iterations: int, seed: int,
+                   **kwargs) -> DolphinEcholocation:
+    benchmark = BENCHMARKS[function_name]
+    return DolphinEcholocation(benchmark['function'], d, [benchmark['bounds']] * d,
+                               population_size=n, max_iterations=iterations,
+                               seed=seed, verbose=False, **kwargs)
+
+
+def time_kernel(func, repeats: int) -> float:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeats, number)) / number
+
+
+def peak_memory(function_name: str, n: int, d: int, seed: int) -> int:
+    tracemalloc.start()
+    try:
+        make_optimizer(function_name, n, d, 1, seed).optimize()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_cell(function_name: str, n: int, d: int, iterations: int, seed: int) -> dict:
+    timer = IterationTimer()
+    de = make_optimizer(function_name, n, d, iterations, seed, callbacks=[timer])
+    start = time.perf_counter()
+    de.optimize()
+    total = time.perf_counter() - start
+
+    per_iteration = np.diff(timer.stamps)
+    return {
+        'function': function_name,
+        'population_size': n,
+        'dimension': d,
+        'iterations': de.iteration_count,
+        'total_seconds': total,
+        'time_per_iteration': float(np.median(per_iteration)) if len(per_iteration) else None,
+        'time_per_iteration_max': float(np.max(per_iteration)) if len(per_iteration) else None,
+        'evaluations_per_second': de.function_evaluations / total,
+        'peak_memory_bytes': peak_memory(function_name, n, d, seed)
+    }
+
+
+def run_kernels(n: int, d: int, repeats: int, seed: int) -> list:
+    de = make_optimizer('sphere', n, d, 100, seed)
+    de.tell(sphere_function(de.ask()))
+    dolphin = de.dolphins[0]
+    af_value = 1.0 / n
+    target = dolphin.position.copy()
+
+    kernels = {
+        'calculate_accumulative_fitness': lambda: de.calculate_accumulative_fitness(1),
+        'update_positions': lambda: de.update_positions(1, np.full(n, af_value)),
+        'update_dolphin_position': lambda: de.update_dolphin_position(dolphin, 1, af_value),
+        'calculate_convergence_factor': de.calculate_convergence_factor,
+        'Dolphin.update_position': lambda: dolphin.update_position(target),
+    }
+    return [{'kernel': name, 'population_size': n, 'dimension': d,
+             'seconds': time_kernel(kernels[name], repeats)} for name in KERNELS]
+
+
+def environment() -> dict:
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count()
+    }
+
+
+def run(args) -> dict:
+    sizes = args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    dims = args.dims or (QUICK_DIMS if args.quick else DEFAULT_DIMS)
+
+    results = {'environment': environment(),
+               'settings': {'sizes': sizes, 'dims': dims, 'functions': args.functions,
+                            'iterations': args.iterations, 'repeats': args.repeats,
+                            'seed': args.seed},
+               'runs': [], 'kernels': []}
+
+    print(f"{'Function':<11} {'N':>6} {'D':>5} {'ms/iter':>10} {'evals/s':>11} {'peak MiB':>9}")
+    for function_name in args.functions:
+        for n in sizes:
+            for d in dims:
+                cell = run_cell(function_name, n, d, args.iterations, args.seed)
+                results['runs'].append(cell)
+                print(f"{function_name:<11} {n:>6} {d:>5} {cell['time_per_iteration'] * 1e3:>10.3f} "
+                      f"{cell['evaluations_per_second']:>11.0f} "
+                      f"{cell['peak_memory_bytes'] / 2**20:>9.1f}")
+
+    print(f"\n{'Kernel':<31} {'N':>6} {'D':>5} {'time (us)':>12}")
+    for n in sizes:
+        for d in dims:
+            for row in run_kernels(n, d, args.repeats, args.seed):
+                results['kernels'].append(row)
+                print(f"{row['kernel']:<31} {n:>6} {d:>5} {row['seconds'] * 1e6:>12.2f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to: {args.output}")
+    return results
+
+
+def _index(rows: list, keys: tuple) -> dict:
+    return {tuple(row[key] for key in keys): row for row in rows}
+
+
+def compare(baseline: dict, candidate: dict, threshold: float) -> list:
+    """
+    Returns one entry per (cell, metric) present in both files, with the
+    relative change and whether it is a regression beyond `threshold`.
+    """
+    rows = []
+    for section, keys in (('runs', ('function', 'population_size', 'dimension')),
+                          ('kernels', ('kernel', 'population_size', 'dimension'))):
+        old_rows = _index(baseline.get(section, []), keys)
+        new_rows = _index(candidate.get(section, []), keys)
+        for key in sorted(old_rows.keys() & new_rows.keys(), key=str):
+            for metric, higher_is_better in METRICS.items():
+                old = old_rows[key].get(metric)
+                new = new_rows[key].get(metric)
+                if not old or new is None:
+                    continue
+                change = new / old - 1
+                worse = -change if higher_is_better else change
+                rows.append({'section': section, 'key': key, 'metric': metric,
+                             'baseline': old, 'candidate': new, 'change': change,
+                             'regression': worse > threshold})
+    return rows
+
+
+def main_compare(args) -> int:
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(args.candidate, encoding='utf-8') as f:
+        candidate = json.load(f)
+
+    rows = compare(baseline, candidate, args.threshold)
+    print(f"{'Cell':<44} {'Metric':<23} {'Baseline':>12} {'Candidate':>12} {'Change':>8}")
+    print("-" * 104)
+    for row in rows:
+        flag = '  REGRESSION' if row['regression'] else ''
+        cell = ' '.join(str(part) for part in row['key'])
+        print(f"{cell:<44} {row['metric']:<23} {row['baseline']:>12.4g} "
+              f"{row['candidate']:>12.4g} {row['change']:>+7.1%}{flag}")
+
+    regressions = sum(row['regression'] for row in rows)
+    print(f"\n{regressions} regression(s) beyond {args.threshold:.0%} in {len(rows)} comparisons")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Run the benchmark grid')
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=None)
+    run_parser.add_argument('--dims', type=int, nargs='+', default=None)
+    run_parser.add_argument('--functions', nargs='+', default=list(BENCHMARKS),
+                            choices=list(BENCHMARKS))
+    run_parser.add_argument('--iterations', type=int, default=5)
+    run_parser.add_argument('--repeats', type=int, default=3)
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--quick', action='store_true',
+                            help='Small grid for smoke runs')
+    run_parser.add_argument('--output', type=str, default=None)
+
+    compare_parser = commands.add_parser('compare', help='Flag regressions between two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('candidate')
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help='Relative change counted as a regression (default 0.1)')
+
+    args = parser.parse_args()
+    if args.command == 'compare':
+        sys.exit(main_compare(args))
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Observer interface for the Dolphin Echolocation optimization loop.
+
+Subclass `Callback` and override only the events you need. Iteration 0 is
+the evaluated initial population, matching index 0 of the histories. When
+no callbacks are attached the optimizer skips event dispatch entirely.
+"""
+
+import numpy as np
+
+
+class Callback:
+
+    def on_start(self, optimizer):
+        pass
+
+    def on_iteration_end(self, optimizer, iteration: int, pp: float):
+        pass
+
+    def on_new_best(self, optimizer, fitness: float, position: np.ndarray):
+        pass
+
+    def on_termination(self, optimizer, execution_time: float):
+        pass
+
+
+class ConsoleReporter(Callback):
+
+    def __init__(self, every: int = 10):
+        self.every = every
+
+    def on_start(self, optimizer):
+        print("=" * 70)
+        print("Enhanced Dolphin Echolocation Optimization")
+        print("Based on: Kaveh & Farhoudi (2013)")
+        print("=" * 70)
+        print(f"Population size (NL): {optimizer.population_size}")
+        print(f"Max iterations: {optimizer.max_iterations}")
+        print(f"Dimensions: {optimizer.dimension}")
+        print(f"Initial PP (PP_1): {optimizer.pp_initial:.2f}")
+        print(f"Power parameter: {optimizer.power:.2f}")
+        print(f"Initial effective radius (Re): {optimizer.re_initial:.4f}")
+        print("-" * 70)
+
+    def on_iteration_end(self, optimizer, iteration: int, pp: float):
+        if iteration == 0:
+            print(f"Initial best fitness: {optimizer.best_fitness:.6e}")
+        elif iteration % self.every == 0 or iteration == 1:
+            re_current = optimizer.calculate_re(iteration - 1)
+            print(f"Iter {iteration:3d}/{optimizer.max_iterations}: "
+                  f"Best = {optimizer.best_fitness:.6e} | "
+                  f"PP = {pp:.3f} | "
+                  f"Re = {re_current:.4f}")
+
+    def on_termination(self, optimizer, execution_time: float):
+        print("-" * 70)
+        print(f"✓ Optimization completed in {execution_time:.2f} seconds")
+        print(f"✓ Stop reason: {optimizer.stop_reason}")
+        print(f"✓ Total function evaluations: {optimizer.function_evaluations}")
+        if optimizer.cache is not None:
+            print(f"✓ Cache hits/misses/evictions: "
+                  f"{optimizer.cache_hits}/{optimizer.cache_misses}/{optimizer.cache_evictions}")
+        print(f"✓ Final best fitness: {optimizer.best_fitness:.6e}")
+        print(f"✓ Best position: {optimizer.best_position}")
+        print("=" * 70)
@@ -0,0 +1,126 @@
+"""
+Checkpoint and resume for DolphinEcholocation.
+
+A checkpoint is a single .npz archive holding everything the synchronous
+loop needs to continue bit-for-bit: positions, fitness, the best solution,
+iteration and evaluation counters, the recorded histories, the cached AF of
+the next iteration, the generator state, the stopping-criteria window and
+the evaluation cache. The objective function and the constructor settings
+are not stored; build the optimizer with the same arguments, then call
+load_checkpoint before optimize().
+
+Files are written to a temporary file in the target directory, fsynced and
+moved into place with os.replace, so a crash mid-write leaves the previous
+checkpoint intact.
+"""
+
+import json
+import os
+import tempfile
+
+import numpy as np
+
+
+CHECKPOINT_VERSION = 1
+
+_HISTORIES = ('convergence_history', 'pp_history', 'cf_history',
+              'fitness_history', 'position_history')
+
+
+def atomic_savez(path: str, **arrays):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.checkpoint-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def save_checkpoint(optimizer, path: str):
+    if optimizer.best_position is None:
+        raise RuntimeError("nothing to checkpoint before the population is initialized")
+    if optimizer._asked is not None:
+        raise RuntimeError("cannot checkpoint between ask() and tell()")
+    if optimizer._moves is not None:
+        raise RuntimeError("cannot checkpoint in the middle of an iteration")
+
+    arrays = {
+        'version': np.array(CHECKPOINT_VERSION),
+        'positions': optimizer.positions,
+        'fitness': optimizer.fitness,
+        'best_position': optimizer.best_position,
+        'best_fitness': np.array(optimizer.best_fitness),
+        'iteration_count': np.array(optimizer.iteration_count),
+        'function_evaluations': np.array(optimizer.function_evaluations),
+        'elapsed': np.array(optimizer.elapsed_time),
+        'stop_reason': np.array(optimizer.stop_reason or ''),
+        'rng_state': np.array(json.dumps(optimizer.rng.bit_generator.state))
+    }
+
+    for name in _HISTORIES:
+        history = getattr(optimizer, name)
+        if history is not None:
+            arrays[name] = history.to_array()
+            arrays[name + '_iterations'] = history.frame_iterations
+            arrays[name + '_offered'] = np.array(history.offered)
+
+    if optimizer._next_af is not None:
+        arrays['next_af_iteration'] = np.array(optimizer._next_af[0])
+        arrays['next_af'] = optimizer._next_af[1]
+
+    if optimizer.stopping is not None:
+        arrays['stopping_recent_best'] = np.array(optimizer.stopping.recent_best, dtype=float)
+
+    cache = optimizer.cache
+    if cache is not None:
+        arrays['cache_keys'], arrays['cache_values'] = cache.export()
+        arrays['cache_counters'] = np.array([cache.hits, cache.misses, cache.evictions])
+
+    atomic_savez(path, **arrays)
+
+
+def load_checkpoint(optimizer, path: str):
+    with np.load(path) as data:
+        if int(data['version']) != CHECKPOINT_VERSION:
+            raise ValueError(f"unsupported checkpoint version {int(data['version'])}")
+        if data['positions'].shape != optimizer.positions.shape:
+            raise ValueError(f"checkpoint population shape {data['positions'].shape} does not "
+                             f"match the optimizer's {optimizer.positions.shape}")
+
+        rng_state = json.loads(str(data['rng_state']))
+        if rng_state['bit_generator'] != type(optimizer.rng.bit_generator).__name__:
+            raise ValueError(f"checkpoint was written with a {rng_state['bit_generator']} "
+                             f"generator")
+        optimizer.rng.bit_generator.state = rng_state
+
+        optimizer.positions[...] = data['positions']
+        optimizer.fitness[...] = data['fitness']
+        optimizer.best_position = data['best_position'].copy()
+        optimizer.best_fitness = float(data['best_fitness'])
+        optimizer.iteration_count = int(data['iteration_count'])
+        optimizer.function_evaluations = int(data['function_evaluations'])
+        optimizer.stop_reason = str(data['stop_reason']) or None
+
+        for name in _HISTORIES:
+            history = getattr(optimizer, name)
+            if history is not None and name in data:
+                history.restore(data[name], data[name + '_iterations'],
+                                int(data[name + '_offered']))
+
+        optimizer._next_af = None
+        if 'next_af' in data:
+            optimizer._next_af = (int(data['next_af_iteration']), data['next_af'].copy())
+
+        if optimizer.cache is not None and 'cache_keys' in data:
+            hits, misses, evictions = (int(c) for c in data['cache_counters'])
+            optimizer.cache.restore(data['cache_keys'], data['cache_values'],
+                                    hits, misses, evictions)
+
+        recent_best = data['stopping_recent_best'] if 'stopping_recent_best' in data else None
+        return float(data['elapsed']), recent_best
@@ -0,0 +1,392 @@
+"""
+Distributed objective evaluation over TCP or Unix sockets.
+
+An EvaluationCoordinator listens on a socket; workers (run_worker, possibly
+on other machines) connect, pull chunks of positions and send back their
+fitness values. The coordinator is itself a batch objective, so it plugs
+straight into DolphinEcholocation or an ask/tell loop:
+
+    with EvaluationCoordinator(('0.0.0.0', 5555), chunksize=16) as coordinator:
+        de = DolphinEcholocation(coordinator, dimension, bounds)
+        de.optimize()
+
+    # on each worker machine
+    python distributed.py worker --connect host:5555 --objective dolphin:rastrigin_function
+
+Workers own the objective function; only position and fitness arrays cross
+the wire. While evaluating, a worker sends a heartbeat every
+`heartbeat_interval` seconds. A worker that holds a chunk and stays silent
+for `heartbeat_timeout` seconds, or whose connection drops, is dropped and
+its chunk is re-queued for the remaining workers. An exception raised by
+the objective is not retried; it fails the batch with an EvaluationError.
+evaluate() raises WorkersUnavailable once no worker has been connected for
+`worker_timeout` seconds while it waits, and closing the coordinator fails
+every batch that is still pending.
+
+Wire format: every message is a 13-byte header (type: u8, job id: u64,
+payload length: u32, network byte order) followed by the payload. Arrays
+are sent as (rows: u32, cols: u32, itemsize: u8) followed by the raw
+little-endian float32/float64 data.
+"""
+
+import argparse
+import importlib
+import multiprocessing
+import os
+import socket
+import struct
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Callable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from evaluation import EvaluationError, as_batch_objective, evaluate_batch
+
+
+Address = Union[Tuple[str, int], str]
+
+READY, TASK, RESULT, ERROR, HEARTBEAT, SHUTDOWN = range(1, 7)
+
+HEADER = struct.Struct('!BQI')
+ARRAY_HEADER = struct.Struct('!IIB')
+
+
+class RemoteEvaluationError(RuntimeError):
+    """An objective raised on a worker; the message carries the remote traceback."""
+
+
+class WorkerLost(ConnectionError):
+    pass
+
+
+class WorkersUnavailable(RuntimeError):
+    """No worker could finish a batch: none connected in time, or the coordinator closed."""
+
+
+def encode_array(array: np.ndarray) -> bytes:
+    array = np.asarray(array)
+    dtype = '<f4' if array.dtype == np.float32 else '<f8'
+    array = np.ascontiguousarray(array, dtype=dtype)
+    rows, cols = array.reshape(array.shape[0], -1).shape if array.ndim else (1, 1)
+    return ARRAY_HEADER.pack(rows, cols, array.itemsize) + array.tobytes()
+
+
+def decode_array(payload: bytes) -> np.ndarray:
+    rows, cols, itemsize = ARRAY_HEADER.unpack_from(payload)
+    dtype = '<f4' if itemsize == 4 else '<f8'
+    data = np.frombuffer(payload, dtype=dtype, count=rows * cols, offset=ARRAY_HEADER.size)
+    return data.reshape(rows, cols)
+
+
+def send_message(sock: socket.socket, kind: int, job_id: int = 0, payload: bytes = b''):
+    sock.sendall(HEADER.pack(kind, job_id, len(payload)) + payload)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            raise WorkerLost("connection closed")
+        received += count
+    return bytes(buffer)
+
+
+def recv_message(sock: socket.socket) -> Tuple[int, int, bytes]:
+    kind, job_id, length = HEADER.unpack(_recv_exact(sock, HEADER.size))
+    return kind, job_id, _recv_exact(sock, length) if length else b''
+
+
+def _make_socket(address: Address) -> socket.socket:
+    family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+    return socket.socket(family, socket.SOCK_STREAM)
+
+
+class _Batch:
+
+    def __init__(self, n: int):
+        self.fitness = np.empty(n)
+        self.remaining = 0
+        self.error = None
+        self.failure = None
+        self.done = threading.Event()
+
+
+class _Job:
+
+    __slots__ = ('job_id', 'batch', 'start', 'stop', 'payload')
+
+    def __init__(self, job_id: int, batch: _Batch, start: int, stop: int, payload: bytes):
+        self.job_id = job_id
+        self.batch = batch
+        self.start = start
+        self.stop = stop
+        self.payload = payload
+
+
+class EvaluationCoordinator:
+
+    batched = True
+    concurrent = True
+
+    def __init__(self,
+                 address: Address = ('127.0.0.1', 0),
+                 chunksize: int = 8,
+                 heartbeat_timeout: float = 10.0,
+                 worker_timeout: Optional[float] = 60.0):
+        self.chunksize = max(1, int(chunksize))
+        self.heartbeat_timeout = heartbeat_timeout
+        self.worker_timeout = worker_timeout
+
+        self._server = _make_socket(address)
+        if not isinstance(address, str):
+            self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(address)
+        self._server.listen()
+        self.address = self._server.getsockname()
+
+        self._condition = threading.Condition()
+        self._queue = deque()
+        self._next_job_id = 1
+        self._closed = False
+        self._pending = set()
+        self._no_workers_since = time.monotonic()
+        self.workers = 0
+        self.requeued = 0
+        self.evaluations = 0
+
+        self._accept_thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self._accept_thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        return self.evaluate(positions)
+
+    def wait_for_workers(self, count: int, timeout: Optional[float] = None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: self.workers >= count, timeout)
+
+    def evaluate(self, positions: np.ndarray) -> np.ndarray:
+        positions = np.atleast_2d(positions)
+        n = positions.shape[0]
+        batch = _Batch(n)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("coordinator is closed")
+            for start in range(0, n, self.chunksize):
+                stop = min(start + self.chunksize, n)
+                self._queue.append(_Job(self._next_job_id, batch, start, stop,
+                                        encode_array(positions[start:stop])))
+                self._next_job_id += 1
+                batch.remaining += 1
+            if batch.remaining == 0:
+                batch.done.set()
+            else:
+                self._pending.add(batch)
+            self._condition.notify_all()
+
+        while not batch.done.wait(min(1.0, self.worker_timeout or 1.0)):
+            with self._condition:
+                idle = time.monotonic() - self._no_workers_since
+                if (self.workers == 0 and self.worker_timeout is not None
+                        and idle >= self.worker_timeout):
+                    self._fail(batch, WorkersUnavailable(
+                        f"no worker connected for {self.worker_timeout:g} seconds"))
+        if batch.failure is not None:
+            raise batch.failure
+        if batch.error is not None:
+            start, stop, message = batch.error
+            cause = RemoteEvaluationError(message)
+            raise EvaluationError(start, stop, cause) from cause
+        return batch.fitness
+
+    def close(self):
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            for batch in list(self._pending):
+                self._fail(batch, WorkersUnavailable("coordinator was closed"))
+            self._condition.notify_all()
+        self._server.close()
+        if isinstance(self.address, str):
+            try:
+                os.unlink(self.address)
+            except OSError:
+                pass
+
+    def _accept_loop(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve_worker, args=(conn,), daemon=True).start()
+
+    def _fail(self, batch: _Batch, failure: Exception):
+        """Finish a pending batch with an error and drop its queued chunks (lock held)."""
+        batch.failure = failure
+        self._pending.discard(batch)
+        self._queue = deque(job for job in self._queue if job.batch is not batch)
+        batch.done.set()
+
+    def _next_job(self) -> Optional[_Job]:
+        with self._condition:
+            self._condition.wait_for(lambda: self._queue or self._closed)
+            if self._closed:
+                return None
+            return self._queue.popleft()
+
+    def _serve_worker(self, conn: socket.socket):
+        with self._condition:
+            self.workers += 1
+            self._condition.notify_all()
+        job = None
+        try:
+            while True:
+                kind, _, _ = recv_message(conn)
+                if kind == HEARTBEAT:
+                    continue
+                if kind != READY:
+                    raise WorkerLost(f"unexpected message type {kind}")
+
+                job = self._next_job()
+                if job is None:
+                    send_message(conn, SHUTDOWN)
+                    return
+                send_message(conn, TASK, job.job_id, job.payload)
+                conn.settimeout(self.heartbeat_timeout)
+                while True:
+                    kind, job_id, payload = recv_message(conn)
+                    if kind != HEARTBEAT and job_id == job.job_id:
+                        break
+                conn.settimeout(None)
+                self._complete(job, kind, payload)
+                job = None
+        except (OSError, WorkerLost, struct.error):
+            pass
+        finally:
+            conn.close()
+            with self._condition:
+                self.workers -= 1
+                if self.workers == 0:
+                    self._no_workers_since = time.monotonic()
+                if job is not None and not self._closed and not job.batch.done.is_set():
+                    self._queue.appendleft(job)
+                    self.requeued += 1
+                self._condition.notify_all()
+
+    def _complete(self, job: _Job, kind: int, payload: bytes):
+        batch = job.batch
+        with self._condition:
+            if batch.done.is_set():
+                return
+            if kind == RESULT:
+                batch.fitness[job.start:job.stop] = decode_array(payload).reshape(-1)
+                self.evaluations += job.stop - job.start
+            elif batch.error is None or job.start < batch.error[0]:
+                batch.error = (job.start, job.stop, payload.decode('utf-8', 'replace'))
+            batch.remaining -= 1
+            if batch.remaining == 0:
+                self._pending.discard(batch)
+                batch.done.set()
+
+
+def run_worker(address: Address,
+               objective_function: Callable,
+               heartbeat_interval: float = 1.0):
+    """
+    Connect to a coordinator and evaluate chunks until it shuts down or the
+    connection drops.
+    """
+    batch_function = as_batch_objective(objective_function)
+    sock = _make_socket(address)
+    sock.connect(address)
+    send_lock = threading.Lock()
+
+    def send(kind: int, job_id: int = 0, payload: bytes = b''):
+        with send_lock:
+            send_message(sock, kind, job_id, payload)
+
+    def heartbeat(job_id: int, stop: threading.Event):
+        while not stop.wait(heartbeat_interval):
+            send(HEARTBEAT, job_id)
+
+    try:
+        send(READY)
+        while True:
+            kind, job_id, payload = recv_message(sock)
+            if kind == SHUTDOWN:
+                return
+            if kind != TASK:
+                continue
+
+            stop = threading.Event()
+            beater = threading.Thread(target=heartbeat, args=(job_id, stop), daemon=True)
+            beater.start()
+            try:
+                fitness = evaluate_batch(batch_function, decode_array(payload))
+                reply = (RESULT, encode_array(fitness.astype(np.float64)))
+            except Exception:
+                reply = (ERROR, traceback.format_exc().encode('utf-8'))
+            finally:
+                stop.set()
+                beater.join()
+            send(reply[0], job_id, reply[1])
+            send(READY)
+    except (OSError, WorkerLost):
+        pass
+    finally:
+        sock.close()
+
+
+def spawn_local_workers(address: Address, objective_function: Callable, count: int,
+                        heartbeat_interval: float = 1.0) -> List[multiprocessing.Process]:
+    """Start `count` worker processes on this machine (for tests and single-host runs)."""
+    workers = []
+    for _ in range(count):
+        worker = multiprocessing.Process(target=run_worker, daemon=True,
+                                         args=(address, objective_function, heartbeat_interval))
+        worker.start()
+        workers.append(worker)
+    return workers
+
+
+def parse_address(text: str) -> Address:
+    if ':' in text and not text.startswith('/'):
+        host, port = text.rsplit(':', 1)
+        return host, int(port)
+    return text
+
+
+def load_objective(spec: str) -> Callable:
+    module_name, _, function_name = spec.partition(':')
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distributed evaluation worker")
+    commands = parser.add_subparsers(dest='command', required=True)
+    worker_parser = commands.add_parser('worker', help='Connect to a coordinator and evaluate')
+    worker_parser.add_argument('--connect', required=True,
+                               help='host:port for TCP or a filesystem path for a Unix socket')
+    worker_parser.add_argument('--objective', required=True,
+                               help='Objective as module:function, e.g. dolphin:sphere_function')
+    worker_parser.add_argument('--heartbeat', type=float, default=1.0)
+    args = parser.parse_args()
+
+    run_worker(parse_address(args.connect), load_objective(args.objective), args.heartbeat)
+
+
+if __name__ == "__main__":
+    main()
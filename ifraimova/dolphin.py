@@ -1,31 +1,138 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
-from typing import Callable, Tuple, List
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Callable, Tuple, List, Optional, Union
 import time
+import warnings
 
+from evaluation import (EvaluationCache, EvaluationError, as_batch_objective, batch_objective,
+                        evaluate_batch, evaluate_chunk, evaluate_parallel, is_batch_objective,
+                        is_concurrent_objective, make_executor)
+from kernels import (DEFAULT_MEMORY_LIMIT, accumulative_fitness, population_geometry,
+                     sample_columns)
+from callbacks import Callback, ConsoleReporter
+from checkpoint import load_checkpoint, save_checkpoint
+from history import FrameHistory
+from profiling import PhaseProfiler, phase
+from stopping import MAX_ITERATIONS, StoppingCriteria
 
-class Dolphin:
+
+SeedLike = Union[int, np.random.SeedSequence, np.random.Generator, None]
+
+
+FLOAT_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+
+def resolve_dtype(dtype) -> np.dtype:
+    dtype = np.dtype(dtype)
+    if dtype not in FLOAT_DTYPES:
+        raise ValueError(f"dtype must be float64 or float32, got {dtype}")
+    return dtype
+
+
+def make_rng(seed: SeedLike = None) -> np.random.Generator:
+    if isinstance(seed, np.random.Generator):
+        return seed
+    if seed is None:
+        # Derive the stream from the legacy global state so that
+        # np.random.seed(...) keeps controlling unseeded runs.
+        seed = np.random.randint(0, 2**63 - 1, dtype=np.int64)
+    return np.random.default_rng(seed)
+
+
+def best_index(fitness: np.ndarray) -> Optional[int]:
+    """Row with the lowest fitness, ignoring NaN; None when every value is NaN."""
+    if np.isnan(fitness).all():
+        return None
+    return int(np.nanargmin(fitness))
+
+
+def spawn_rngs(seed: SeedLike, n: int) -> List[np.random.Generator]:
+    if isinstance(seed, np.random.Generator):
+        seed = np.random.SeedSequence(int(seed.integers(0, 2**63 - 1)))
+    elif not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return [np.random.default_rng(child) for child in seed.spawn(n)]
+
+
+class Population:
     
-    def __init__(self, dimension: int, bounds: List[Tuple[float, float]]):
+    def __init__(self, dimension: int, bounds: List[Tuple[float, float]], size: int,
+                 rng: np.random.Generator = None, dtype=np.float64):
         self.dimension = dimension
         self.bounds = bounds
-        self.position = np.array([
-            np.random.uniform(bounds[i][0], bounds[i][1]) 
-            for i in range(dimension)
-        ])
-        self.fitness = float('inf')
-        self.velocity = np.zeros(dimension)
+        self.size = size
+        self.rng = make_rng(rng)
+        self.dtype = resolve_dtype(dtype)
+        limits = np.asarray(bounds, dtype=float)[:dimension]
+        self.lower = np.ascontiguousarray(limits[:, 0], dtype=self.dtype)
+        self.upper = np.ascontiguousarray(limits[:, 1], dtype=self.dtype)
+        self.positions = self.rng.uniform(self.lower, self.upper,
+                                          (size, dimension)).astype(self.dtype, copy=False)
+        self.fitness = np.full(size, float('inf'))
+    
+    def set_positions(self, new_positions: np.ndarray):
+        np.clip(new_positions, self.lower, self.upper, out=self.positions)
+    
+    def dolphin(self, index: int) -> 'Dolphin':
+        return Dolphin.view(self, index)
+
+
+class Dolphin:
+    
+    __slots__ = ('_population', '_index')
+    
+    def __init__(self, dimension: int, bounds: List[Tuple[float, float]],
+                 rng: np.random.Generator = None):
+        self._population = Population(dimension, bounds, 1, rng)
+        self._index = 0
+    
+    @classmethod
+    def view(cls, population: Population, index: int) -> 'Dolphin':
+        dolphin = cls.__new__(cls)
+        dolphin._population = population
+        dolphin._index = index
+        return dolphin
+    
+    @property
+    def dimension(self) -> int:
+        return self._population.dimension
+    
+    @property
+    def bounds(self) -> List[Tuple[float, float]]:
+        return self._population.bounds
+    
+    @property
+    def position(self) -> np.ndarray:
+        return self._population.positions[self._index]
+    
+    @position.setter
+    def position(self, value: np.ndarray):
+        self._population.positions[self._index] = value
+    
+    @property
+    def fitness(self) -> float:
+        return self._population.fitness[self._index]
+    
+    @fitness.setter
+    def fitness(self, value: float):
+        self._population.fitness[self._index] = value
+    
+    @property
+    def velocity(self) -> np.ndarray:
+        return np.zeros(self.dimension)
         
     def evaluate(self, objective_function: Callable) -> float:
-        self.fitness = objective_function(self.position)
+        if is_batch_objective(objective_function):
+            self.fitness = objective_function(self.position[None, :])[0]
+        else:
+            self.fitness = objective_function(self.position)
         return self.fitness
     
     def update_position(self, new_position: np.ndarray):
-        for i in range(self.dimension):
-            self.position[i] = np.clip(new_position[i], 
-                                      self.bounds[i][0], 
-                                      self.bounds[i][1])
+        np.clip(new_position, self._population.lower, self._population.upper,
+                out=self.position)
 
 
 class DolphinEcholocation:
@@ -40,9 +147,29 @@ class DolphinEcholocation:
                  pp_initial: float = 0.15,
                  power: float = 0.5,
                  re_initial: float = None,
-                 track_positions: bool = False):
+                 track_positions: bool = False,
+                 track_fitness: bool = False,
+                 history_stride: int = 1,
+                 history_keep_last: Optional[int] = None,
+                 history_path: Optional[str] = None,
+                 af_memory_limit: int = DEFAULT_MEMORY_LIMIT,
+                 neighbor_search: str = 'brute',
+                 backend: str = 'numpy',
+                 dtype=np.float64,
+                 sparse_fraction: Optional[float] = None,
+                 update_block: Optional[int] = None,
+                 cache: Union[int, EvaluationCache, None] = None,
+                 seed: SeedLike = None,
+                 stopping: Optional[StoppingCriteria] = None,
+                 callbacks: Optional[List[Callback]] = None,
+                 checkpoint_path: Optional[str] = None,
+                 checkpoint_every: Optional[int] = None,
+                 checkpoint_interval: Optional[float] = None,
+                 verbose: bool = True,
+                 profile: bool = False):
       
         self.objective_function = objective_function
+        self.batch_function = as_batch_objective(objective_function)
         self.dimension = dimension
         self.bounds = bounds
         self.population_size = population_size
@@ -54,33 +181,195 @@ class DolphinEcholocation:
         self.power = power 
         
         if re_initial is None:
-            search_space_size = np.mean([bounds[i][1] - bounds[i][0] for i in range(dimension)])
+            limits = np.asarray(bounds, dtype=float)[:dimension]
+            search_space_size = np.mean(limits[:, 1] - limits[:, 0])
             self.re_initial = 0.25 * search_space_size
         else:
             self.re_initial = re_initial
         
-        self.dolphins = [Dolphin(dimension, bounds) for _ in range(population_size)]
+        self.executor = None
+        self.chunksize = 1
+        self.cache = EvaluationCache(cache) if isinstance(cache, int) else cache
+        
+        self.af_memory_limit = af_memory_limit
+        # spatial_index (scipy) and jit_kernels (numba) are imported only when
+        # selected, so the defaults do not pay for loading them.
+        if neighbor_search != 'brute':
+            from spatial_index import NEIGHBOR_SEARCH_METHODS
+            if neighbor_search not in NEIGHBOR_SEARCH_METHODS:
+                raise ValueError(f"neighbor_search must be one of {NEIGHBOR_SEARCH_METHODS}, "
+                                 f"got {neighbor_search!r}")
+        self.neighbor_search = neighbor_search
+        
+        self.backend = 'numpy'
+        self._af_kernel = accumulative_fitness
+        self._geometry_kernel = population_geometry
+        if backend != 'numpy':
+            import jit_kernels
+            self.backend = jit_kernels.resolve_backend(backend)
+            if self.backend == 'numba':
+                self._af_kernel = jit_kernels.accumulative_fitness
+                self._geometry_kernel = jit_kernels.population_geometry
+        
+        self.rng = make_rng(seed)
+        self.dtype = resolve_dtype(dtype)
+        self.population = Population(dimension, bounds, population_size, self.rng, self.dtype)
+        
+        # Sparse mode moves only this many randomly chosen coordinates of
+        # each dolphin per iteration (distinct coordinates per dolphin).
+        self.sparse_coordinates = None
+        if sparse_fraction is not None:
+            if not 0 < sparse_fraction <= 1:
+                raise ValueError("sparse_fraction must be in (0, 1]")
+            coordinates = max(1, int(round(sparse_fraction * dimension)))
+            if coordinates < dimension:
+                self.sparse_coordinates = coordinates
+        block_width = self.sparse_coordinates or dimension
+        self._direction_block = np.empty((population_size, block_width), dtype=self.dtype)
+        
+        # Dolphins are moved and evaluated update_block at a time, and every
+        # later block is steered by the best solution found so far; 1 is the
+        # original one-by-one update. Whole-pod moves (update_block >= N)
+        # start from the iteration's best and converge less reliably, but
+        # give concurrent evaluation a full batch. None decides per run: the
+        # whole pod for ask(), an executor or a concurrent objective (such as
+        # an EvaluationCoordinator), one dolphin at a time otherwise.
+        if update_block is not None and update_block < 1:
+            raise ValueError("update_block must be a positive integer or None")
+        self.update_block = update_block
+        self._block_size = population_size
+        self._dolphins = None
+        self._next_af = None
         
         self.best_position = None
         self.best_fitness = float('inf')
-        self.convergence_history = []
-        self.pp_history = [] 
-        self.cf_history = [] 
+        self.convergence_history = FrameHistory(max_iterations + 1, ())
+        self.pp_history = FrameHistory(max_iterations + 1, ())
+        self.cf_history = FrameHistory(max_iterations + 1, ())
+        
+        self.track_fitness = track_fitness
+        self.fitness_history = None
+        if track_fitness:
+            self.fitness_history = FrameHistory(max_iterations + 1, (population_size,))
         
         self.track_positions = track_positions
-        self.position_history = [] if track_positions else None
+        self.position_history = None
+        if track_positions:
+            self.position_history = FrameHistory(max_iterations + 1, (population_size, dimension),
+                                                 dtype=self.dtype,
+                                                 stride=history_stride,
+                                                 keep_last=history_keep_last,
+                                                 path=history_path)
         
         self.iteration_count = 0
         self.function_evaluations = 0
         
+        self.stopping = stopping
+        self.stop_reason = None
+        self._start_time = None
+        self._running = False
+        self._initialized = False
+        self._asked = None
+        self._moves = None
+        self._next_row = 0
+        
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_interval = checkpoint_interval
+        self._last_checkpoint = None
+        self._resume = None
+        
+        self.callbacks = list(callbacks) if callbacks else []
+        self.verbose = verbose
+        self._observers = []
+        
+        self.profiler = PhaseProfiler() if profile else None
+    
+    @property
+    def positions(self) -> np.ndarray:
+        return self.population.positions
+    
+    @property
+    def fitness(self) -> np.ndarray:
+        return self.population.fitness
+    
+    @property
+    def dolphins(self) -> List[Dolphin]:
+        if self._dolphins is None:
+            self._dolphins = [self.population.dolphin(i) for i in range(self.population_size)]
+        return self._dolphins
+    
+    @property
+    def cache_hits(self) -> int:
+        return self.cache.hits if self.cache is not None else 0
+    
+    @property
+    def cache_misses(self) -> int:
+        return self.cache.misses if self.cache is not None else 0
+    
+    @property
+    def cache_evictions(self) -> int:
+        return self.cache.evictions if self.cache is not None else 0
+    
+    def evaluate_positions(self, positions: np.ndarray) -> np.ndarray:
+        if self.cache is None:
+            return self._evaluate_uncached(positions)
+        
+        fitness, keys, missing, cached = self.cache.lookup(positions)
+        if len(missing):
+            fresh = {}
+            for idx, value in zip(missing, self._evaluate_uncached(positions[missing])):
+                fresh[keys[idx]] = value
+                self.cache.put(keys[idx], value)
+            for idx in np.flatnonzero(~cached):
+                fitness[idx] = fresh[keys[idx]]
+        return fitness
+    
+    def _evaluate_uncached(self, positions: np.ndarray) -> np.ndarray:
+        if self.executor is not None:
+            fitness = evaluate_parallel(self.objective_function, positions,
+                                        self.executor, self.chunksize)
+        else:
+            fitness = evaluate_batch(self.batch_function, positions)
+        self.function_evaluations += positions.shape[0]
+        return fitness
+    
+    def evaluate_population(self):
+        self.fitness[:] = self.evaluate_positions(self.positions)
+        
+        self._update_best(best_index(self.fitness))
+    
+    def _update_best(self, idx: Optional[int]):
+        if idx is not None and self.fitness[idx] < self.best_fitness:
+            self.best_fitness = self.fitness[idx]
+            self.best_position = self.positions[idx].astype(np.float64)
+            if self._observers:
+                for observer in self._observers:
+                    observer.on_new_best(self, self.best_fitness, self.best_position)
+    
+    def inject(self, positions: np.ndarray, fitness: np.ndarray) -> np.ndarray:
+        """
+        Replace the worst dolphins with already evaluated solutions (e.g.
+        migrants from another pod). Must be called between tell() and the
+        next ask(). Returns the indices that were overwritten.
+        """
+        if self._asked is not None or self._moves is not None:
+            raise RuntimeError("inject() can only be called between iterations")
+        positions = np.atleast_2d(positions)
+        fitness = np.asarray(fitness, dtype=float).reshape(-1)
+        count = min(len(fitness), self.population_size)
+        if count == 0:
+            return np.empty(0, dtype=int)
+        worst = np.argsort(self.fitness, kind='stable')[::-1][:count]
+        self.positions[worst] = positions[:count]
+        self.fitness[worst] = fitness[:count]
+        self._next_af = None
+        best = best_index(fitness[:count])
+        self._update_best(None if best is None else int(worst[best]))
+        return worst
+    
     def initialize_population(self):
-        for dolphin in self.dolphins:
-            fitness = dolphin.evaluate(self.objective_function)
-            self.function_evaluations += 1
-            
-            if fitness < self.best_fitness:
-                self.best_fitness = fitness
-                self.best_position = dolphin.position.copy()
+        self.evaluate_population()
     
     def calculate_pp(self, iteration: int) -> float:
         if self.max_iterations <= 1:
@@ -92,42 +381,56 @@ class DolphinEcholocation:
         
         return pp
     
+    def calculate_re(self, iteration: int) -> float:
+        return self.re_initial * (1 - iteration / self.max_iterations)
+    
     def calculate_accumulative_fitness(self, iteration: int) -> np.ndarray:
-        re = self.re_initial * (1 - iteration / self.max_iterations)
-        
-        af = np.zeros(self.population_size)
+        if self._next_af is not None and self._next_af[0] == iteration:
+            af = self._next_af[1]
+            self._next_af = None
+            return af
         
-        for i, dolphin_i in enumerate(self.dolphins):
-            for j, dolphin_j in enumerate(self.dolphins):
-                distance = np.linalg.norm(dolphin_i.position - dolphin_j.position)
-                
-                if distance < re:
-                    influence = (1 / re) * (re - distance) if re > 0 else 0
-                    
-                    fitness_contribution = 1.0 / (1.0 + dolphin_j.fitness)
-                    
-                    af[i] += influence * fitness_contribution
-        
-        epsilon = 1e-10
-        af = af + epsilon
-        
-        return af
+        re = self.calculate_re(iteration)
+        if self.neighbor_search == 'brute':
+            return self._af_kernel(self.positions, self.fitness, re, self.af_memory_limit)
+        from spatial_index import indexed_accumulative_fitness
+        return indexed_accumulative_fitness(self.positions, self.fitness, re,
+                                            self.neighbor_search, self.af_memory_limit)
     
     def calculate_convergence_factor(self) -> float:
-        if not self.dolphins:
+        if self.population_size == 0:
             return 0.0
         
-        close_count = 0
         threshold = self.re_initial * 0.1 
         
-        for dolphin in self.dolphins:
-            distance = np.linalg.norm(dolphin.position - self.best_position)
-            if distance < threshold:
-                close_count += 1
+        distances = np.linalg.norm(self.positions - self._working_best(), axis=1)
+        close_count = np.count_nonzero(distances < threshold)
         
         cf = (close_count / self.population_size) * 100
         return cf
     
+    def _working_best(self) -> np.ndarray:
+        # The best position is kept in float64; vector arithmetic against
+        # the population uses it in the working dtype to avoid upcasting.
+        return self.best_position.astype(self.dtype, copy=False)
+    
+    def _measure_geometry(self, next_iteration: int) -> float:
+        if self.neighbor_search != 'brute':
+            from spatial_index import indexed_accumulative_fitness
+            af = indexed_accumulative_fitness(self.positions, self.fitness,
+                                              self.calculate_re(next_iteration),
+                                              self.neighbor_search, self.af_memory_limit)
+            self._next_af = (next_iteration, af)
+            return self.calculate_convergence_factor()
+        
+        af, close_count = self._geometry_kernel(self.positions, self.fitness,
+                                                self.calculate_re(next_iteration),
+                                                self._working_best(),
+                                                self.re_initial * 0.1,
+                                                self.af_memory_limit)
+        self._next_af = (next_iteration, af)
+        return (close_count / self.population_size) * 100
+    
     def calculate_location_quality(self, dolphin: Dolphin) -> float:
         if self.best_fitness == 0:
             return 1.0
@@ -136,101 +439,517 @@ class DolphinEcholocation:
     def update_dolphin_position(self, dolphin: Dolphin, iteration: int, af_value: float):
         pp = self.calculate_pp(iteration)
         
-        re = self.re_initial * (1 - iteration / self.max_iterations)
-        
-        global_component = pp * (self.best_position - dolphin.position)
+        re = self.calculate_re(iteration)
         
-        random_direction = np.random.uniform(-1, 1, self.dimension)
-        local_component = (1 - pp) * af_value * re * random_direction
+        if self.sparse_coordinates is not None:
+            self._update_dolphin_sparse(dolphin, pp, re, af_value)
+            return
         
-        neighbor_idx = np.random.randint(0, self.population_size)
+        random_direction = self.rng.uniform(-1, 1, self.dimension)
+        neighbor_idx = self.rng.integers(0, self.population_size)
         neighbor = self.dolphins[neighbor_idx]
         social_weight = 0.1 * (1 - pp) 
+        
+        if self.backend == 'numba':
+            import jit_kernels
+            jit_kernels.move_dolphin(dolphin.position, self.best_position, random_direction,
+                                     (1 - pp) * af_value * re, neighbor.position, pp,
+                                     social_weight, self.population.lower, self.population.upper)
+            return
+        
+        global_component = pp * (self.best_position - dolphin.position)
+        local_component = (1 - pp) * af_value * re * random_direction
         social_component = social_weight * (neighbor.position - dolphin.position)
         
         new_position = dolphin.position + global_component + local_component + social_component
         
         dolphin.update_position(new_position)
     
-    def optimize(self) -> Tuple[np.ndarray, float, List[float]]:
-        print("=" * 70)
-        print("Enhanced Dolphin Echolocation Optimization")
-        print("Based on: Kaveh & Farhoudi (2013)")
-        print("=" * 70)
-        print(f"Population size (NL): {self.population_size}")
-        print(f"Max iterations: {self.max_iterations}")
-        print(f"Dimensions: {self.dimension}")
-        print(f"Initial PP (PP_1): {self.pp_initial:.2f}")
-        print(f"Power parameter: {self.power:.2f}")
-        print(f"Initial effective radius (Re): {self.re_initial:.4f}")
-        print("-" * 70)
+    def update_positions(self, iteration: int, af_normalized: np.ndarray):
+        """Move the whole pod at once, every dolphin steered by the current best."""
+        self._move_rows(self._draw_moves(iteration, af_normalized), 0, self.population_size)
+    
+    def _draw_moves(self, iteration: int, af_normalized: np.ndarray) -> tuple:
+        # Every random number of an iteration is drawn up front, so the
+        # stream does not depend on update_block.
+        pp = self.calculate_pp(iteration)
+        re = self.calculate_re(iteration)
+        n = self.population_size
+        
+        cols = None
+        if self.sparse_coordinates is not None:
+            cols = sample_columns(self.rng, n, self.dimension, self.sparse_coordinates)
+        
+        random_direction = self.rng.random(out=self._direction_block, dtype=self.dtype)
+        random_direction *= 2
+        random_direction -= 1
+        neighbor_idx = self.rng.integers(0, n, n)
+        return iteration, pp, re, (1 - pp) * af_normalized, neighbor_idx, cols
+    
+    def _move_rows(self, moves: tuple, start: int, stop: int):
+        iteration, pp, re, scale, neighbor_idx, cols = moves
+        rows = slice(start, stop)
+        random_direction = self._direction_block[rows]
+        neighbors = neighbor_idx[rows]
+        social_weight = 0.1 * (1 - pp)
+        positions = self.positions
+        
+        if cols is not None:
+            self._move_rows_sparse(start, stop, cols[rows], pp, re, scale[rows],
+                                   random_direction, neighbors)
+            return
         
-        start_time = time.time()
+        if self.backend == 'numba':
+            # The direction rows are consumed one by one, so they double as
+            # the output buffer; the neighbours' old rows stay intact.
+            import jit_kernels
+            jit_kernels.move_pod(positions, start, self.best_position, random_direction,
+                                 (scale[rows] * re).astype(self.dtype),
+                                 neighbors, pp, social_weight,
+                                 self.population.lower, self.population.upper,
+                                 out=random_direction)
+            positions[rows] = random_direction
+            return
+        
+        current = positions[rows]
+        global_component = pp * (self._working_best() - current)
+        local_component = scale[rows].astype(self.dtype, copy=False)[:, None] * re * random_direction
+        social_component = social_weight * (positions[neighbors] - current)
+        
+        new_positions = current + global_component + local_component + social_component
+        
+        np.clip(new_positions, self.population.lower, self.population.upper, out=current)
     
-        self.initialize_population()
+    def _move_rows_sparse(self, start: int, stop: int, cols: np.ndarray, pp: float, re: float,
+                          scale: np.ndarray, random_direction: np.ndarray,
+                          neighbors: np.ndarray):
+        rows = np.arange(start, stop)[:, None]
+        social_weight = 0.1 * (1 - pp)
+        
+        # All reads happen before the scatter, so every dolphin of the block
+        # still sees its neighbour's previous coordinates.
+        positions = self.positions
+        current = positions[rows, cols]
+        global_component = pp * (self._working_best()[cols] - current)
+        local_component = scale.astype(self.dtype, copy=False)[:, None] * re * random_direction
+        social_component = social_weight * (positions[neighbors[:, None], cols] - current)
         
+        new_values = current + global_component + local_component + social_component
+        positions[rows, cols] = np.clip(new_values, self.population.lower[cols],
+                                        self.population.upper[cols])
+    
+    def _update_dolphin_sparse(self, dolphin: Dolphin, pp: float, re: float, af_value: float):
+        cols = self.rng.choice(self.dimension, self.sparse_coordinates, replace=False)
+        random_direction = self.rng.uniform(-1, 1, self.sparse_coordinates)
+        neighbor = self.dolphins[self.rng.integers(0, self.population_size)]
+        social_weight = 0.1 * (1 - pp)
+        
+        position = dolphin.position
+        current = position[cols]
+        new_values = (current + pp * (self.best_position[cols] - current)
+                      + (1 - pp) * af_value * re * random_direction
+                      + social_weight * (neighbor.position[cols] - current))
+        position[cols] = np.clip(new_values, self.population.lower[cols],
+                                 self.population.upper[cols])
+    
+    def _record_state(self, pp: float, cf: float = None):
         if self.convergence_curve:
             self.convergence_history.append(self.best_fitness)
-            self.pp_history.append(self.pp_initial)
-            self.cf_history.append(0.0)
+            self.pp_history.append(pp)
+            self.cf_history.append(self.calculate_convergence_factor() if cf is None else cf)
+        
+        if self.track_fitness:
+            self.fitness_history.append(self.fitness)
         
         if self.track_positions:
-            positions = np.array([d.position for d in self.dolphins])
-            self.position_history.append(positions.copy())
+            self.position_history.append(self.positions)
+    
+    def export_history(self) -> dict:
+        """
+        Recorded histories as arrays of length iteration_count + 1 (views into
+        the preallocated buffers, not copies).
+        """
+        histories = {
+            'convergence': self.convergence_history.to_array(),
+            'pp': self.pp_history.to_array(),
+            'cf': self.cf_history.to_array()
+        }
+        if self.track_fitness:
+            histories['fitness'] = self.fitness_history.to_array()
+        return histories
+    
+    @property
+    def elapsed_time(self) -> float:
+        return time.time() - self._start_time if self._start_time is not None else 0.0
+    
+    def save_checkpoint(self, path: Optional[str] = None):
+        """
+        Write the state of the synchronous loop to an .npz file (atomically).
+        Call between iterations; a run in asynchronous mode cannot be saved.
+        """
+        path = path or self.checkpoint_path
+        if path is None:
+            raise ValueError("no checkpoint path given")
+        save_checkpoint(self, path)
+        self._last_checkpoint = time.time()
+    
+    def load_checkpoint(self, path: Optional[str] = None):
+        """
+        Restore a checkpoint written by an optimizer built with the same
+        arguments. The next optimize() continues from the saved iteration
+        instead of initializing a new population.
+        """
+        path = path or self.checkpoint_path
+        if path is None:
+            raise ValueError("no checkpoint path given")
+        self._resume = load_checkpoint(self, path)
+    
+    def _auto_checkpoint(self):
+        if self.checkpoint_path is None:
+            return
+        due = bool(self.checkpoint_every) and self.iteration_count % self.checkpoint_every == 0
+        if not due and self.checkpoint_interval is not None:
+            due = time.time() - self._last_checkpoint >= self.checkpoint_interval
+        if due:
+            self.save_checkpoint()
+    
+    def _resume_run(self, console: bool = False, batch: bool = False):
+        elapsed, recent_best = self._resume
+        self._resume = None
+        iteration_count, stop_reason = self.iteration_count, self.stop_reason
+        self._reset_run(console, batch)
+        self._start_time -= elapsed
+        self.iteration_count, self.stop_reason = iteration_count, stop_reason
+        self._initialized = True
+        if self.stopping is not None and recent_best is not None:
+            self.stopping.restore(recent_best)
+    
+    def _evaluates_concurrently(self) -> bool:
+        return self.executor is not None or is_concurrent_objective(self.objective_function)
+    
+    def _resolve_update_block(self, batch: bool) -> int:
+        if self.update_block is not None:
+            return min(self.update_block, self.population_size)
+        if batch or self._evaluates_concurrently():
+            return self.population_size
+        return 1
+    
+    def _reset_run(self, console: bool = False, batch: bool = False):
+        self._block_size = self._resolve_update_block(batch)
+        self._start_time = time.time()
+        self._last_checkpoint = self._start_time
+        self._running = True
+        self._initialized = False
+        self._asked = None
+        self._moves = None
+        self.iteration_count = 0
+        self.stop_reason = None
+        if self.stopping is not None:
+            self.stopping.reset()
         
-        print(f"Initial best fitness: {self.best_fitness:.6e}")
+        self._observers = list(self.callbacks)
+        if console and self.verbose:
+            self._observers.append(ConsoleReporter())
+        if self._observers:
+            for observer in self._observers:
+                observer.on_start(self)
+    
+    def ask(self) -> np.ndarray:
+        """
+        Next batch of candidate positions. The first call of a run returns
+        the initial population, shape (N, D). With the default update_block
+        every later call moves the whole pod, so one ask/tell round is one
+        iteration. With update_block=B a call returns the next B dolphins,
+        shape (B, D) (the last block of an iteration may be shorter), moved
+        from the best found so far; an iteration then takes ceil(N / B)
+        rounds. Calling ask() again before tell() returns the same batch. Evaluate the rows in order and pass the values to tell().
+        Once the run has stopped, the next ask() starts a new run from the
+        current population, like a second optimize() call.
+        """
+        self._ensure_running(batch=True)
+        return self._ask().copy()
+    
+    def iterate(self) -> Optional[str]:
+        """
+        Run the rest of the current iteration (the initial evaluation on the
+        first call of a run) with the optimizer's own objective, and return
+        the stop reason once a stopping criterion fires.
+        """
+        if self._asked is not None:
+            raise RuntimeError("iterate() cannot be called between ask() and tell()")
+        self._ensure_running()
+        return self._step()
+    
+    def _ensure_running(self, batch: bool = False):
+        if not self._running:
+            if self._resume is not None:
+                self._resume_run(batch=batch)
+            else:
+                self._reset_run(batch=batch)
+    
+    def tell(self, fitness: np.ndarray) -> Optional[str]:
+        """
+        Feed back the objective values of the batch returned by ask(). Updates
+        the best solution, PP, Re, AF and the histories, and returns the stop
+        reason once a stopping criterion fires (None otherwise). Every tell()
+        must answer exactly one pending ask(); anything else is a RuntimeError.
+        """
+        if self._asked is None:
+            raise RuntimeError("tell() called without a pending ask()")
+        fitness = np.asarray(fitness, dtype=float).reshape(-1)
+        expected = self._asked[1] - self._asked[0]
+        if fitness.shape != (expected,):
+            raise ValueError(f"expected {expected} fitness values, got {fitness.shape[0]}")
+        self.function_evaluations += expected
+        return self._tell(fitness)
+    
+    def _ask(self) -> np.ndarray:
+        if self._asked is not None:
+            start, stop = self._asked
+            return self.positions[start:stop]
+        if not self._initialized:
+            self._asked = (0, self.population_size)
+            return self.positions
         
-        for iteration in range(self.max_iterations):
-            self.iteration_count = iteration + 1
-            
-            pp = self.calculate_pp(iteration)
-            
+        if self._moves is None:
+            self._begin_iteration()
+        start = self._next_row
+        stop = min(start + self._block_size, self.population_size)
+        with phase(self.profiler, 'position_update'):
+            self._move_rows(self._moves, start, stop)
+        
+        self._asked = (start, stop)
+        return self.positions[start:stop]
+    
+    def _begin_iteration(self):
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.begin_iteration()
+        
+        iteration = self.iteration_count
+        
+        with phase(profiler, 'accumulative_fitness'):
             af_values = self.calculate_accumulative_fitness(iteration)
-            
-            af_sum = np.sum(af_values)
-            if af_sum > 0:
-                af_normalized = af_values / af_sum
+        
+        af_sum = np.sum(af_values)
+        if af_sum > 0:
+            af_normalized = af_values / af_sum
+        else:
+            af_normalized = np.ones(self.population_size) / self.population_size
+        
+        with phase(profiler, 'position_update'):
+            self._moves = self._draw_moves(iteration, af_normalized)
+        self._next_row = 0
+    
+    def _tell(self, fitness: np.ndarray) -> Optional[str]:
+        if not self._initialized:
+            self._asked = None
+            self.fitness[:] = fitness
+            self._update_best(best_index(self.fitness))
+            self._initialized = True
+            with phase(self.profiler, 'history'):
+                self._record_state(self.pp_initial, 0.0)
+            self._emit_iteration_end(0, self.pp_initial)
+            if self.max_iterations <= 0:
+                self.stop_reason = MAX_ITERATIONS
+                self._finish()
+            return self.stop_reason
+        
+        start, stop = self._asked
+        self._asked = None
+        block = self.fitness[start:stop]
+        block[:] = fitness
+        best = best_index(block)
+        self._update_best(None if best is None else start + best)
+        if stop < self.population_size:
+            self._next_row = stop
+            return self.stop_reason
+        
+        profiler = self.profiler
+        iteration, pp = self._moves[:2]
+        self._moves = None
+        self.iteration_count = iteration + 1
+        
+        cf = None
+        if self.convergence_curve:
+            with phase(profiler, 'geometry'):
+                cf = self._measure_geometry(iteration + 1)
+        with phase(profiler, 'history'):
+            self._record_state(pp, cf)
+        
+        if profiler is not None:
+            profiler.end_iteration()
+        
+        self._emit_iteration_end(iteration + 1, pp)
+        
+        if self._check_stopping() is not None:
+            self._finish()
+        return self.stop_reason
+    
+    def _step(self) -> Optional[str]:
+        while True:
+            candidates = self._ask()
+            with phase(self.profiler, 'evaluation'):
+                fitness = self.evaluate_positions(candidates)
+            self._tell(fitness)
+            if self._moves is None:
+                return self.stop_reason
+    
+    def _emit_iteration_end(self, iteration: int, pp: float):
+        if self._observers:
+            for observer in self._observers:
+                observer.on_iteration_end(self, iteration, pp)
+    
+    def _check_stopping(self) -> Optional[str]:
+        if self.stopping is not None and self.stop_reason is None:
+            self.stop_reason = self.stopping.check(self, time.time() - self._start_time)
+        if self.stop_reason is None and self.iteration_count >= self.max_iterations:
+            self.stop_reason = MAX_ITERATIONS
+        return self.stop_reason
+    
+    def _finish(self) -> float:
+        self._running = False
+        if self.track_positions:
+            self.position_history.finalize(self.positions)
+            self.position_history.flush()
+        execution_time = time.time() - self._start_time
+        if self._observers:
+            for observer in self._observers:
+                observer.on_termination(self, execution_time)
+        return execution_time
+    
+    @property
+    def profile_stats(self) -> Optional[dict]:
+        return self.profiler.stats() if self.profiler is not None else None
+    
+    def optimize(self,
+                 executor: Union[str, Executor, None] = None,
+                 chunksize: int = 1,
+                 max_workers: Optional[int] = None,
+                 asynchronous: bool = False) -> Tuple[np.ndarray, float, List[float]]:
+        if asynchronous and executor is None:
+            raise ValueError("asynchronous=True requires an executor")
+        if asynchronous and self._resume is not None:
+            raise ValueError("a checkpoint can only be resumed by the synchronous loop")
+        
+        owned = executor is not None and not isinstance(executor, Executor)
+        self.executor = make_executor(executor, max_workers)
+        self.chunksize = chunksize
+        if not asynchronous and self.update_block == 1 and self._evaluates_concurrently():
+            warnings.warn("update_block=1 evaluates one dolphin at a time, so the "
+                          "executor gets no concurrent work; leave update_block unset "
+                          "to evaluate the whole pod at once", RuntimeWarning, stacklevel=2)
+        try:
+            return self._optimize_async() if asynchronous else self._optimize()
+        finally:
+            if owned:
+                self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+    
+    def _optimize(self) -> Tuple[np.ndarray, float, List[float]]:
+        if self._resume is not None:
+            self._resume_run(console=True)
+            if self.stop_reason is not None:
+                self._finish()
+        else:
+            self._reset_run(console=True)
+        
+        while self.stop_reason is None:
+            self._step()
+            if self.stop_reason is None and self.iteration_count > 0:
+                self._auto_checkpoint()
+        
+        return self.best_position, self.best_fitness, self.convergence_history.to_array()
+    
+    def _optimize_async(self) -> Tuple[np.ndarray, float, List[float]]:
+        """
+        Steady-state variant without a generation barrier: every finished
+        evaluation updates the best solution and immediately resubmits that
+        dolphin from a new position. PP and Re follow the number of completed
+        evaluations (N completions count as one iteration), and the total
+        budget matches the synchronous run, N * (max_iterations + 1).
+        """
+        self._reset_run(console=True)
+        n = self.population_size
+        budget = n * (self.max_iterations + 1)
+        pending = {}
+        af_sum = None
+        
+        cache_keys = {}
+        
+        def submit(idx: int):
+            position = self.positions[idx:idx + 1].copy()
+            cached = None
+            if self.cache is not None:
+                cache_keys[idx] = self.cache.key(position[0])
+                cached = self.cache.get(cache_keys[idx])
+            if cached is None:
+                future = self.executor.submit(evaluate_chunk, self.objective_function, position)
             else:
-                af_normalized = np.ones(self.population_size) / self.population_size
-            
-            for idx, dolphin in enumerate(self.dolphins):
-                self.update_dolphin_position(dolphin, iteration, af_normalized[idx])
-                
-                fitness = dolphin.evaluate(self.objective_function)
-                self.function_evaluations += 1
+                future = Future()
+                future.set_result(np.array([cached]))
+                future.cached = True
+            pending[future] = idx
+        
+        for idx in range(n):
+            submit(idx)
+        submitted = n
+        completed = 0
+        
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=pending.get):
+                    idx = pending.pop(future)
+                    if future.exception() is not None:
+                        raise EvaluationError(idx, idx + 1, future.exception()) from future.exception()
+                    
+                    self.fitness[idx] = future.result()[0]
+                    if not getattr(future, 'cached', False):
+                        self.function_evaluations += 1
+                        if self.cache is not None:
+                            self.cache.put(cache_keys[idx], self.fitness[idx])
+                    completed += 1
+                    self._update_best(idx)
+                    
+                    iteration = min(max(0.0, (completed - n) / n), self.max_iterations - 1)
+                    if completed % n == 0:
+                        af_sum = self._record_async_progress(completed // n - 1)
+                        if self.iteration_count > 0 and self._check_stopping() is not None:
+                            break
+                    
+                    if submitted < budget and self.best_position is not None:
+                        re = self.calculate_re(iteration)
+                        af_value = self._af_kernel(self.positions, self.fitness, re,
+                                                   self.af_memory_limit, rows=[idx])[0]
+                        af_normalized = af_value / af_sum if af_sum else 1.0 / n
+                        self.update_dolphin_position(self.dolphins[idx], iteration, af_normalized)
+                        submit(idx)
+                        submitted += 1
                 
-                if fitness < self.best_fitness:
-                    self.best_fitness = fitness
-                    self.best_position = dolphin.position.copy()
-            
-            if self.convergence_curve:
-                self.convergence_history.append(self.best_fitness)
-                self.pp_history.append(pp)
-                cf = self.calculate_convergence_factor()
-                self.cf_history.append(cf)
-            
-            if self.track_positions:
-                positions = np.array([d.position for d in self.dolphins])
-                self.position_history.append(positions.copy())
-            
-            if (iteration + 1) % 10 == 0 or iteration == 0:
-                re_current = self.re_initial * (1 - iteration / self.max_iterations)
-                print(f"Iter {iteration + 1:3d}/{self.max_iterations}: "
-                      f"Best = {self.best_fitness:.6e} | "
-                      f"PP = {pp:.3f} | "
-                      f"Re = {re_current:.4f}")
+                if self.stop_reason is not None:
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
         
-        end_time = time.time()
-        execution_time = end_time - start_time
+        self._finish()
         
-        print("-" * 70)
-        print(f"✓ Optimization completed in {execution_time:.2f} seconds")
-        print(f"✓ Total function evaluations: {self.function_evaluations}")
-        print(f"✓ Final best fitness: {self.best_fitness:.6e}")
-        print(f"✓ Best position: {self.best_position}")
-        print("=" * 70)
+        return self.best_position, self.best_fitness, self.convergence_history.to_array()
+    
+    def _record_async_progress(self, iteration: int) -> float:
+        self.iteration_count = iteration
+        if iteration == 0:
+            self._record_state(self.pp_initial, 0.0)
+            self._emit_iteration_end(0, self.pp_initial)
+        else:
+            pp = self.calculate_pp(iteration - 1)
+            self._record_state(pp)
+            self._emit_iteration_end(iteration, pp)
         
-        return self.best_position, self.best_fitness, self.convergence_history
+        re = self.calculate_re(iteration)
+        return float(np.sum(self._af_kernel(self.positions, self.fitness, re,
+                                            self.af_memory_limit)))
     
     def plot_convergence(self, save_path: str = None):
         if not self.convergence_history:
@@ -269,7 +988,7 @@ class DolphinEcholocation:
         if self.cf_history:
             ax3.plot(iterations, self.cf_history, 'r-', linewidth=2, label='CF (Actual)')
             if self.pp_history:
-                pp_percentage = [p * 100 for p in self.pp_history]
+                pp_percentage = self.pp_history.to_array() * 100
                 ax3.plot(iterations, pp_percentage, 'g--', linewidth=1.5,
                         alpha=0.7, label='PP × 100')
         ax3.set_xlabel('Iteration', fontsize=11)
@@ -333,23 +1052,27 @@ class DolphinEcholocation:
         plt.show()
 
 
+@batch_objective
 def sphere_function(x: np.ndarray) -> float:
-    return np.sum(x**2)
+    return np.sum(x**2, axis=-1)
 
 
+@batch_objective
 def rastrigin_function(x: np.ndarray) -> float:
-    n = len(x)
-    return 10 * n + np.sum(x**2 - 10 * np.cos(2 * np.pi * x))
+    n = x.shape[-1]
+    return 10 * n + np.sum(x**2 - 10 * np.cos(2 * np.pi * x), axis=-1)
 
 
+@batch_objective
 def rosenbrock_function(x: np.ndarray) -> float:
-    return np.sum(100 * (x[1:] - x[:-1]**2)**2 + (1 - x[:-1])**2)
+    return np.sum(100 * (x[..., 1:] - x[..., :-1]**2)**2 + (1 - x[..., :-1])**2, axis=-1)
 
 
+@batch_objective
 def ackley_function(x: np.ndarray) -> float:
-    n = len(x)
-    sum1 = np.sum(x**2)
-    sum2 = np.sum(np.cos(2 * np.pi * x))
+    n = x.shape[-1]
+    sum1 = np.sum(x**2, axis=-1)
+    sum2 = np.sum(np.cos(2 * np.pi * x), axis=-1)
     return -20 * np.exp(-0.2 * np.sqrt(sum1 / n)) - np.exp(sum2 / n) + 20 + np.e
 
 
@@ -0,0 +1,201 @@
+"""
+Objective-function evaluation for the Dolphin Echolocation algorithm.
+
+An objective is either scalar (receives one position of shape (D,) and
+returns a float) or batched (receives the whole population as an (N, D)
+array and returns an (N,) array). Batched objectives are declared with
+the `batch_objective` decorator; everything else is treated as scalar
+and wrapped automatically. Objectives that spread a batch over several
+workers themselves (such as EvaluationCoordinator) set `concurrent = True`.
+"""
+
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import (FIRST_EXCEPTION, Executor, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
+from typing import Callable, List, Optional, Tuple, Union
+
+
+def batch_objective(func: Callable) -> Callable:
+    func.batched = True
+    return func
+
+
+def is_batch_objective(func: Callable) -> bool:
+    return bool(getattr(func, 'batched', False))
+
+
+def is_concurrent_objective(func: Callable) -> bool:
+    return bool(getattr(func, 'concurrent', False))
+
+
+def as_batch_objective(func: Callable) -> Callable:
+    if is_batch_objective(func):
+        return func
+
+    def evaluate_rows(positions: np.ndarray) -> np.ndarray:
+        return np.array([func(position) for position in positions], dtype=float)
+
+    evaluate_rows.batched = True
+    evaluate_rows.scalar_function = func
+    return evaluate_rows
+
+
+def evaluate_batch(batch_function: Callable, positions: np.ndarray) -> np.ndarray:
+    fitness = np.asarray(batch_function(positions), dtype=float)
+    if fitness.shape != (positions.shape[0],):
+        raise ValueError(f"Batch objective returned shape {fitness.shape}, "
+                         f"expected ({positions.shape[0]},)")
+    return fitness
+
+
+class EvaluationError(RuntimeError):
+    
+    def __init__(self, start: int, stop: int, cause: BaseException):
+        super().__init__(f"Objective evaluation failed for dolphins {start}..{stop - 1}: "
+                         f"{type(cause).__name__}: {cause}")
+        self.start = start
+        self.stop = stop
+        self.cause = cause
+
+
+def make_executor(executor: Union[str, Executor, None],
+                  max_workers: Optional[int] = None) -> Optional[Executor]:
+    if executor is None or isinstance(executor, Executor):
+        return executor
+    if executor == 'process':
+        return ProcessPoolExecutor(max_workers=max_workers)
+    if executor == 'thread':
+        return ThreadPoolExecutor(max_workers=max_workers)
+    raise ValueError(f"executor must be 'process', 'thread', a concurrent.futures.Executor "
+                     f"or None, got {executor!r}")
+
+
+def evaluate_chunk(objective_function: Callable, positions: np.ndarray) -> np.ndarray:
+    return evaluate_batch(as_batch_objective(objective_function), positions)
+
+
+def evaluate_parallel(objective_function: Callable,
+                      positions: np.ndarray,
+                      executor: Executor,
+                      chunksize: int = 1) -> np.ndarray:
+    """
+    Evaluate the rows of `positions` on `executor` in chunks of `chunksize`.
+    Results are written back by row index, so the returned array does not
+    depend on the order in which workers finish.
+    """
+    n = positions.shape[0]
+    chunksize = max(1, int(chunksize))
+    futures = {}
+    for start in range(0, n, chunksize):
+        stop = min(start + chunksize, n)
+        future = executor.submit(evaluate_chunk, objective_function, positions[start:stop])
+        futures[future] = (start, stop)
+    
+    done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+    failures = [future for future in done if future.exception() is not None]
+    if failures:
+        for future in pending:
+            future.cancel()
+        first = min(failures, key=lambda future: futures[future])
+        start, stop = futures[first]
+        raise EvaluationError(start, stop, first.exception()) from first.exception()
+    
+    fitness = np.empty(n)
+    for future, (start, stop) in futures.items():
+        fitness[start:stop] = future.result()
+    return fitness
+
+
+class EvaluationCache:
+    """
+    Bounded LRU cache of objective values.
+
+    Positions are keyed on their exact float64 bytes, or, when `tolerance`
+    is set, on the position rounded to a grid of that spacing so that
+    near-duplicate points share one evaluation.
+    """
+    
+    def __init__(self, maxsize: int = 10000, tolerance: Optional[float] = None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if tolerance is not None and tolerance <= 0:
+            raise ValueError("tolerance must be positive")
+        self.maxsize = maxsize
+        self.tolerance = tolerance
+        self._values = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._values)
+    
+    def key(self, position: np.ndarray) -> bytes:
+        position = np.asarray(position, dtype=float)
+        if self.tolerance is None:
+            return np.ascontiguousarray(position).tobytes()
+        return np.round(position / self.tolerance).astype(np.int64).tobytes()
+    
+    def get(self, key: bytes) -> Optional[float]:
+        if key in self._values:
+            self._values.move_to_end(key)
+            self.hits += 1
+            return self._values[key]
+        self.misses += 1
+        return None
+    
+    def put(self, key: bytes, value: float):
+        self._values[key] = value
+        self._values.move_to_end(key)
+        while len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+            self.evictions += 1
+    
+    def lookup(self, positions: np.ndarray) -> Tuple[np.ndarray, List[bytes], np.ndarray, np.ndarray]:
+        """
+        Returns the cached fitness (NaN where missing), the keys of all rows,
+        the indices of the rows that still need evaluating and a boolean
+        mask of the rows answered from the cache. Cached values may
+        themselves be NaN, so the mask, not the fitness, tells the two apart.
+        Rows that share a key within the batch are evaluated only once; the
+        repeats count as hits.
+        """
+        keys = [self.key(position) for position in positions]
+        fitness = np.full(len(keys), np.nan)
+        cached = np.zeros(len(keys), dtype=bool)
+        first_seen = {}
+        for idx, key in enumerate(keys):
+            if key in first_seen:
+                self.hits += 1
+                continue
+            value = self.get(key)
+            if value is None:
+                first_seen[key] = idx
+            else:
+                fitness[idx] = value
+                cached[idx] = True
+        return fitness, keys, np.array(sorted(first_seen.values()), dtype=int), cached
+    
+    def export(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Keys as an (entries, key bytes) uint8 array and values, oldest first."""
+        if not self._values:
+            return np.empty((0, 0), dtype=np.uint8), np.empty(0)
+        keys = np.frombuffer(b''.join(self._values), dtype=np.uint8)
+        return keys.reshape(len(self._values), -1), np.fromiter(self._values.values(), float)
+    
+    def restore(self, keys: np.ndarray, values: np.ndarray,
+                hits: int = 0, misses: int = 0, evictions: int = 0):
+        self._values = OrderedDict((key.tobytes(), float(value)) for key, value in zip(keys, values))
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+    
+    def stats(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._values),
+            'maxsize': self.maxsize
+        }
@@ -0,0 +1,103 @@
+"""
+Background execution of a session's optimizer.
+
+A BackgroundRun steps the optimizer in its own thread and publishes every
+iteration's state to the session's stream subscribers, so clients no longer
+drive the run with one HTTP request per iteration. It can be paused,
+resumed and throttled to at most one iteration every `delay` seconds; with
+delay 0 it runs at compute speed. While paused, its thread only waits, so
+the optimizer can still be stepped by hand. An exception from the objective or the
+optimizer ends the run with status 'error' and the message in `error`.
+"""
+
+import threading
+
+
+class BackgroundRun:
+
+    def __init__(self, session, delay: float = 0.0):
+        self.session = session
+        self.delay = max(0.0, float(delay))
+        self.status = 'running'
+        self.error = None
+        self._resumed = threading.Event()
+        self._resumed.set()
+        self._stopped = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @property
+    def running(self) -> bool:
+        return self.status == 'running'
+
+    @property
+    def paused(self) -> bool:
+        return self.status == 'paused'
+
+    def start(self):
+        self.session.publish('status', self.describe())
+        self._thread.start()
+
+    def pause(self):
+        if self.status == 'running':
+            self._resumed.clear()
+            self._set_status('paused')
+
+    def resume(self):
+        if self.status == 'paused':
+            self._set_status('running')
+            self._resumed.set()
+
+    def throttle(self, delay: float):
+        self.delay = max(0.0, float(delay))
+        self._wakeup.set()
+        self.session.publish('status', self.describe())
+
+    def stop(self):
+        self._stopped.set()
+        self._resumed.set()
+        self._wakeup.set()
+
+    def describe(self) -> dict:
+        description = {'status': self.status, 'delay': self.delay}
+        if self.error is not None:
+            description['error'] = self.error
+        return description
+
+    def _set_status(self, status: str):
+        self.status = status
+        self.session.publish('status', self.describe())
+
+    def _run(self):
+        try:
+            self._loop()
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+            self._set_status('error')
+
+    def _loop(self):
+        optimizer = self.session.optimizer
+        while True:
+            self._resumed.wait()
+            if self._stopped.is_set():
+                break
+            with self.session.lock:
+                # pause() or stop() may have landed while this thread
+                # waited for the lock; a paused run must not take a step.
+                if self._stopped.is_set():
+                    break
+                if not self._resumed.is_set():
+                    continue
+                state = optimizer.step(include_history=False)
+            if state is None or state['completed']:
+                if state is not None:
+                    self.session.publish('state', state)
+                self._set_status('completed')
+                return
+            self.session.publish('state', state)
+
+            # A new throttle value or stop() cuts the current wait short.
+            self._wakeup.clear()
+            if self.delay:
+                self._wakeup.wait(self.delay)
+        self._set_status('stopped')
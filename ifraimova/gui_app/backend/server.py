@@ -1,6 +1,8 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
 import numpy as np
+import json
+import queue
 import sys
 import os
 
@@ -8,22 +10,25 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
 
 try:
-    from dolphin import DolphinEcholocation, sphere_function, rastrigin_function, rosenbrock_function
+    from dolphin import DolphinEcholocation, as_batch_objective, sphere_function, rastrigin_function, rosenbrock_function
 except ImportError as e:
     print(f"Error importing dolphin module: {e}")
     print(f"Current path: {os.getcwd()}")
     print(f"Sys path: {sys.path}")
     sys.exit(1)
 
+from runner import BackgroundRun
+from sessions import SessionRegistry, SessionTooLarge, estimate_request_nbytes
+
 app = Flask(__name__)
 CORS(app)
 
-# Global state for optimization
-optimization_state = {
-    'optimizer': None,
-    'function_name': 'sphere',
-    'parameters': {}
-}
+# One optimizer per client session; idle sessions expire after 30 minutes and
+# the least recently used are evicted beyond 64 sessions or 512 MiB of arrays.
+sessions = SessionRegistry(max_sessions=64, ttl=30 * 60, max_bytes=512 * 2**20)
+
+# Seconds between keep-alive comments on an idle event stream
+STREAM_KEEPALIVE = 15
 
 # Available test functions
 FUNCTIONS = {
@@ -48,87 +53,59 @@ FUNCTIONS = {
 }
 
 
+def current_session_id():
+    """Session ID sent by the client in the X-Session-ID header (or ?session_id=)"""
+    return request.headers.get('X-Session-ID') or request.args.get('session_id')
+
+
 class SteppableDolphinEcholocation(DolphinEcholocation):
     """Extended Dolphin Echolocation that supports step-by-step execution"""
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.initialized = False
+        self._convergence_cache = []
         
     def initialize(self):
         """Initialize population without running optimization"""
-        self.initialize_population()
+        self.iterate()
         self.initialized = True
         
-        if self.convergence_curve:
-            self.convergence_history.append(self.best_fitness)
-            self.pp_history.append(self.pp_initial)
-            self.cf_history.append(0.0)
-        
-        if self.track_positions:
-            positions = np.array([d.position for d in self.dolphins])
-            self.position_history.append(positions.copy())
-        
         return self.get_state()
     
-    def step(self):
+    def step(self, include_history=True):
         """Execute one iteration of the algorithm"""
         if not self.initialized:
             return None
         
-        if self.iteration_count >= self.max_iterations:
+        if self.stop_reason is not None:
             return None
         
-        iteration = self.iteration_count
-        
-        # Calculate PP
-        pp = self.calculate_pp(iteration)
-        
-        # Calculate accumulative fitness
-        af_values = self.calculate_accumulative_fitness(iteration)
-        af_sum = np.sum(af_values)
-        if af_sum > 0:
-            af_normalized = af_values / af_sum
-        else:
-            af_normalized = np.ones(self.population_size) / self.population_size
-        
-        # Update each dolphin
-        for idx, dolphin in enumerate(self.dolphins):
-            self.update_dolphin_position(dolphin, iteration, af_normalized[idx])
-            fitness = dolphin.evaluate(self.objective_function)
-            self.function_evaluations += 1
-            
-            if fitness < self.best_fitness:
-                self.best_fitness = fitness
-                self.best_position = dolphin.position.copy()
-        
-        # Update history
-        if self.convergence_curve:
-            self.convergence_history.append(self.best_fitness)
-            self.pp_history.append(pp)
-            cf = self.calculate_convergence_factor()
-            self.cf_history.append(cf)
-        
-        if self.track_positions:
-            positions = np.array([d.position for d in self.dolphins])
-            self.position_history.append(positions.copy())
+        self.iterate()
         
-        self.iteration_count += 1
-        
-        return self.get_state()
+        return self.get_state(include_history)
+    
+    def _convergence_list(self):
+        # Only the entries recorded since the previous call are converted.
+        history = self.convergence_history.to_array()
+        self._convergence_cache.extend(history[len(self._convergence_cache):].tolist())
+        return self._convergence_cache
     
-    def get_state(self):
-        """Get current state of optimization"""
-        return {
+    def get_state(self, include_history=True):
+        """Get current state of optimization (streamed states leave out the growing convergence history)"""
+        state = {
             'iteration': self.iteration_count,
             'best_fitness': float(self.best_fitness),
             'best_position': self.best_position.tolist() if self.best_position is not None else None,
-            'agent_positions': [[float(x) for x in d.position] for d in self.dolphins],
-            'agent_fitness': [float(d.fitness) for d in self.dolphins],
-            'convergence_history': [float(x) for x in self.convergence_history],
+            'agent_positions': self.positions.tolist(),
+            'agent_fitness': self.fitness.tolist(),
             'pp': float(self.calculate_pp(self.iteration_count - 1)) if self.iteration_count > 0 else float(self.pp_initial),
-            'completed': self.iteration_count >= self.max_iterations
+            'completed': self.stop_reason is not None,
+            'stop_reason': self.stop_reason
         }
+        if include_history:
+            state['convergence_history'] = self._convergence_list()
+        return state
 
 
 @app.route('/api/functions', methods=['GET'])
@@ -155,10 +132,21 @@ def initialize_optimization():
     dimension = data.get('dimension', 2)
     population_size = data.get('population_size', 20)
     max_iterations = data.get('max_iterations', 50)
+    seed = data.get('seed')
     
     if function_name not in FUNCTIONS:
         return jsonify({'error': 'Invalid function name'}), 400
     
+    sizes = (dimension, population_size, max_iterations)
+    if not all(isinstance(size, int) and size > 0 for size in sizes):
+        return jsonify({'error': 'dimension, population_size and max_iterations must be positive integers'}), 400
+    
+    # Reject oversized runs before anything is allocated
+    try:
+        sessions.check_size(estimate_request_nbytes(dimension, population_size, max_iterations))
+    except SessionTooLarge as e:
+        return jsonify({'error': str(e)}), 413
+    
     func_info = FUNCTIONS[function_name]
     bounds = [func_info['bounds']] * dimension
     
@@ -170,38 +158,51 @@ def initialize_optimization():
         population_size=population_size,
         max_iterations=max_iterations,
         convergence_curve=True,
-        track_positions=True
+        track_positions=True,
+        seed=seed,
+        verbose=False
     )
     
     # Initialize
     state = optimizer.initialize()
     
-    # Store in global state
-    optimization_state['optimizer'] = optimizer
-    optimization_state['function_name'] = function_name
-    optimization_state['parameters'] = {
+    parameters = {
         'dimension': dimension,
         'population_size': population_size,
         'max_iterations': max_iterations,
         'bounds': func_info['bounds']
     }
     
+    # Store in this client's session (re-initializing replaces it)
+    try:
+        session = sessions.create(optimizer, function_name, parameters,
+                                  session_id=current_session_id())
+    except SessionTooLarge as e:
+        return jsonify({'error': str(e)}), 413
+    
     return jsonify({
         'status': 'initialized',
+        'session_id': session.session_id,
         'state': state,
-        'parameters': optimization_state['parameters']
+        'parameters': parameters
     })
 
 
 @app.route('/api/step', methods=['POST'])
 def step_optimization():
     """Execute one step of optimization"""
-    optimizer = optimization_state.get('optimizer')
+    session = sessions.get(current_session_id())
     
-    if optimizer is None:
-        return jsonify({'error': 'Optimizer not initialized'}), 400
+    if session is None:
+        return jsonify({'error': 'Optimizer not initialized or session expired'}), 400
     
-    state = optimizer.step()
+    # A paused run leaves the optimizer to manual steps until it is resumed
+    if session.run is not None and session.run.running:
+        return jsonify({'error': 'Optimization is running in the background'}), 409
+    
+    # Concurrent steps on the same session run one at a time
+    with session.lock:
+        state = session.optimizer.step()
     
     if state is None:
         return jsonify({'status': 'completed', 'message': 'Optimization finished'})
@@ -212,12 +213,105 @@ def step_optimization():
     })
 
 
+@app.route('/api/run', methods=['POST'])
+def run_optimization():
+    """Run the remaining iterations in the background, streaming each state to /api/stream"""
+    session = sessions.get(current_session_id())
+    
+    if session is None:
+        return jsonify({'error': 'Optimizer not initialized or session expired'}), 400
+    
+    data = request.get_json(silent=True) or {}
+    delay = data.get('delay', 0.0)
+    
+    with session.lock:
+        if session.run is not None and (session.run.running or session.run.paused):
+            session.run.throttle(delay)
+            session.run.resume()
+        else:
+            session.run = BackgroundRun(session, delay)
+            session.run.start()
+    
+    return jsonify(session.run.describe())
+
+
+@app.route('/api/pause', methods=['POST'])
+def pause_optimization():
+    """Pause the background run after the current iteration"""
+    session = sessions.get(current_session_id())
+    
+    if session is None or session.run is None:
+        return jsonify({'error': 'No background run in this session'}), 400
+    
+    # Under the session lock no iteration is in flight, so once this
+    # returns the run thread takes no further step until resumed.
+    with session.lock:
+        session.run.pause()
+    return jsonify(session.run.describe())
+
+
+@app.route('/api/resume', methods=['POST'])
+def resume_optimization():
+    """Resume a paused background run"""
+    session = sessions.get(current_session_id())
+    
+    if session is None or session.run is None:
+        return jsonify({'error': 'No background run in this session'}), 400
+    
+    session.run.resume()
+    return jsonify(session.run.describe())
+
+
+@app.route('/api/throttle', methods=['POST'])
+def throttle_optimization():
+    """Set the minimum delay in seconds between background iterations"""
+    session = sessions.get(current_session_id())
+    
+    if session is None or session.run is None:
+        return jsonify({'error': 'No background run in this session'}), 400
+    
+    data = request.get_json(silent=True) or {}
+    session.run.throttle(data.get('delay', 0.0))
+    return jsonify(session.run.describe())
+
+
+@app.route('/api/stream', methods=['GET'])
+def stream_optimization():
+    """Server-Sent Events: a 'state' event per iteration and a 'status' event on every change"""
+    session_id = current_session_id()
+    session = sessions.get(session_id)
+    
+    if session is None:
+        return jsonify({'error': 'Optimizer not initialized or session expired'}), 400
+    
+    subscriber = session.subscribe()
+    
+    def events():
+        try:
+            if session.run is not None:
+                yield f"event: status\ndata: {json.dumps(session.run.describe())}\n\n"
+            while True:
+                try:
+                    event, data = subscriber.get(timeout=STREAM_KEEPALIVE)
+                except queue.Empty:
+                    # Keeps proxies from closing the connection and the session from expiring
+                    sessions.get(session_id)
+                    yield ": keep-alive\n\n"
+                    continue
+                if event is None:
+                    return
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+        finally:
+            session.unsubscribe(subscriber)
+    
+    return Response(stream_with_context(events()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
 @app.route('/api/reset', methods=['POST'])
 def reset_optimization():
     """Reset optimization state"""
-    optimization_state['optimizer'] = None
-    optimization_state['function_name'] = 'sphere'
-    optimization_state['parameters'] = {}
+    sessions.remove(current_session_id())
     
     return jsonify({'status': 'reset'})
 
@@ -243,24 +337,22 @@ def evaluate_grid():
     y_range = np.linspace(bounds[0], bounds[1], resolution)
     X, Y = np.meshgrid(x_range, y_range)
     
-    # Get dimension from optimizer or use default
-    dimension = optimization_state.get('parameters', {}).get('dimension', 2)
-    
-    # Evaluate function on grid
-    Z = np.zeros_like(X)
-    for i in range(resolution):
-        for j in range(resolution):
-            point = np.zeros(dimension)
-            
-            # Set fixed variables
-            for idx, val in fixed_vars.items():
-                point[int(idx)] = val
-            
-            # Set variable dimensions
-            point[var_indices[0]] = X[i, j]
-            point[var_indices[1]] = Y[i, j]
-            
-            Z[i, j] = func(point)
+    # Get dimension from the session's optimizer or use default
+    session = sessions.get(current_session_id())
+    dimension = session.parameters['dimension'] if session is not None else 2
+    
+    # Evaluate function on grid in a single batch
+    points = np.zeros((X.size, dimension))
+    
+    # Set fixed variables
+    for idx, val in fixed_vars.items():
+        points[:, int(idx)] = val
+    
+    # Set variable dimensions
+    points[:, var_indices[0]] = X.ravel()
+    points[:, var_indices[1]] = Y.ravel()
+    
+    Z = as_batch_objective(func)(points).reshape(X.shape)
     
     return jsonify({
         'x': x_range.tolist(),
@@ -277,4 +369,4 @@ if __name__ == '__main__':
     print("Server starting on http://localhost:5000")
     print("React frontend should connect to this server")
     print("=" * 70)
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
\ No newline at end of file
@@ -0,0 +1,173 @@
+"""
+Per-client optimizer sessions for the GUI server.
+
+Each browser tab gets its own optimizer under a random session ID, so
+concurrent users no longer overwrite each other. Every session carries its
+own lock; requests on one session are serialized while different sessions
+step in parallel. Idle sessions expire after `ttl` seconds, and the least
+recently used ones are evicted when there are more than `max_sessions` of
+them or their estimated array memory exceeds `max_bytes`.
+
+A session is also a small broadcaster: stream subscribers get their own
+bounded queue of (event, data) pairs, and evicting or resetting a session
+stops its background run and ends every stream.
+"""
+
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+
+class SessionTooLarge(ValueError):
+    pass
+
+
+def estimate_request_nbytes(dimension: int, population_size: int, max_iterations: int,
+                            track_positions: bool = True, itemsize: int = 8) -> int:
+    """
+    Bytes an optimizer with these parameters will preallocate, computed
+    before it is built so oversized requests never allocate anything.
+    """
+    frames = max_iterations + 1
+    # positions, random-direction block and the position history
+    population = population_size * dimension * itemsize * (2 + (frames if track_positions else 0))
+    # fitness, best position and the convergence/pp/cf histories
+    scalars = (population_size + dimension + 3 * frames) * 8
+    return population + scalars
+
+
+def estimate_nbytes(optimizer) -> int:
+    """Bytes held by the optimizer's arrays and preallocated histories."""
+    total = 0
+    for owner in (optimizer, getattr(optimizer, 'population', None)):
+        for value in vars(owner).values() if owner is not None else ():
+            nbytes = getattr(value, 'nbytes', None)
+            if isinstance(nbytes, int) and not isinstance(value, np.generic):
+                total += nbytes
+    return total
+
+
+class Session:
+
+    def __init__(self, session_id: str, optimizer, function_name: str, parameters: dict):
+        self.session_id = session_id
+        self.optimizer = optimizer
+        self.function_name = function_name
+        self.parameters = parameters
+        self.lock = threading.Lock()
+        self.nbytes = estimate_nbytes(optimizer)
+        self.last_access = time.monotonic()
+        self.run = None
+        self._subscribers = []
+        self._subscribers_lock = threading.Lock()
+
+    def subscribe(self, maxsize: int = 1000) -> queue.Queue:
+        subscriber = queue.Queue(maxsize)
+        with self._subscribers_lock:
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: queue.Queue):
+        with self._subscribers_lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def publish(self, event: Optional[str], data=None):
+        """
+        Send an event to every subscriber; event None ends their streams. A
+        subscriber that falls `maxsize` events behind loses its oldest ones
+        rather than slowing the run down.
+        """
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            while True:
+                try:
+                    subscriber.put_nowait((event, data))
+                    break
+                except queue.Full:
+                    try:
+                        subscriber.get_nowait()
+                    except queue.Empty:
+                        pass
+
+    def close(self):
+        if self.run is not None:
+            self.run.stop()
+        self.publish(None)
+
+
+class SessionRegistry:
+
+    def __init__(self, max_sessions: int = 64, ttl: float = 30 * 60,
+                 max_bytes: int = 512 * 2**20):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def create(self, optimizer, function_name: str, parameters: dict,
+               session_id: Optional[str] = None) -> Session:
+        """
+        Register a new optimizer, replacing `session_id` if it is given and
+        known, and evict whatever no longer fits.
+        """
+        session = Session(session_id or uuid.uuid4().hex, optimizer, function_name, parameters)
+        self.check_size(session.nbytes)
+        with self._lock:
+            self._discard(session.session_id)
+            self._sessions[session.session_id] = session
+            self.total_bytes += session.nbytes
+            self._evict()
+        return session
+
+    def check_size(self, nbytes: int):
+        """Raise SessionTooLarge if a session of `nbytes` could never fit."""
+        if nbytes > self.max_bytes:
+            raise SessionTooLarge(f"session needs {nbytes / 2**20:.1f} MiB, "
+                                  f"the limit is {self.max_bytes / 2**20:.1f} MiB")
+
+    def get(self, session_id: Optional[str]) -> Optional[Session]:
+        with self._lock:
+            self._expire()
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.last_access = time.monotonic()
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def remove(self, session_id: Optional[str]) -> bool:
+        with self._lock:
+            return self._discard(session_id) is not None
+
+    def _discard(self, session_id) -> Optional[Session]:
+        session = self._sessions.pop(session_id, None)
+        if session is not None:
+            self.total_bytes -= session.nbytes
+            session.close()
+        return session
+
+    def _expire(self):
+        deadline = time.monotonic() - self.ttl
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if oldest.last_access >= deadline:
+                break
+            self._discard(oldest.session_id)
+
+    def _evict(self):
+        # The newest session is last in the order, so it is never evicted here.
+        self._expire()
+        while len(self._sessions) > 1 and (len(self._sessions) > self.max_sessions
+                                           or self.total_bytes > self.max_bytes):
+            self._discard(next(iter(self._sessions)))
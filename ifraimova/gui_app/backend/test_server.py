@@ -0,0 +1,31 @@
+"""
+Tests for the GUI backend's background runs
+"""
+
+import server
+
+
+def test_manual_step_after_pause():
+    client = server.app.test_client()
+    response = client.post('/api/initialize', json={'function': 'sphere', 'seed': 0})
+    session_id = response.get_json()['session_id']
+    headers = {'X-Session-ID': session_id}
+    session = server.sessions.get(session_id)
+    
+    try:
+        # The long delay keeps the run waiting after its first iteration
+        client.post('/api/run', json={'delay': 60}, headers=headers)
+        assert client.post('/api/step', headers=headers).status_code == 409
+        
+        assert client.post('/api/pause', headers=headers).get_json()['status'] == 'paused'
+        with session.lock:
+            iteration = session.optimizer.iteration_count
+        
+        response = client.post('/api/step', headers=headers)
+        assert response.status_code == 200
+        assert response.get_json()['state']['iteration'] == iteration + 1
+        
+        assert client.post('/api/run', headers=headers).get_json()['status'] == 'running'
+        assert session.run.running
+    finally:
+        server.sessions.remove(session_id)
@@ -23,15 +23,18 @@ function App() {
   const [showTrajectories, setShowTrajectories] = useState(true);
 
   const [plotData, setPlotData] = useState(null);
+  const [gridData, setGridData] = useState(null);
 
   const {
     state,
     isRunning,
     agentHistory,
+    throttle,
     initialize,
     step,
     start,
     stop,
+    setThrottle,
     reset,
   } = useOptimization();
 
@@ -50,11 +53,21 @@ function App() {
     setSliderValues(initial);
   }, [dimension]);
 
+  // The contour only depends on the function and the slice, so it is not
+  // refetched for every streamed iteration.
+  const hasState = state !== null;
+
   useEffect(() => {
-    if (state) {
+    if (hasState) {
+      updateGrid();
+    }
+  }, [hasState, selectedFunction, selectedVars, sliderValues]);
+
+  useEffect(() => {
+    if (state && gridData) {
       updateVisualization();
     }
-  }, [state, selectedVars, sliderValues, showTrajectories]);
+  }, [state, gridData, showTrajectories]);
 
   const handleInitialize = async () => {
     const result = await initialize({
@@ -69,8 +82,8 @@ function App() {
     }
   };
 
-  const updateVisualization = async () => {
-    if (!state || selectedVars.length !== 2) return;
+  const updateGrid = async () => {
+    if (selectedVars.length !== 2) return;
 
     const fixedVars = {};
     for (let i = 0; i < dimension; i++) {
@@ -80,34 +93,39 @@ function App() {
     }
 
     try {
-      const gridData = await api.evaluateGrid({
+      const grid = await api.evaluateGrid({
         functionName: selectedFunction,
         fixedVars,
         varIndices: selectedVars,
         resolution: 50,
       });
-
-      const traces = buildPlotData(
-        gridData,
-        state,
-        selectedVars,
-        showTrajectories,
-        agentHistory,
-        functions[selectedFunction]?.name || selectedFunction,
-      );
-
-      const layout = buildPlotLayout(
-        functions[selectedFunction]?.name || selectedFunction,
-        selectedVars,
-        gridData.bounds,
-      );
-
-      setPlotData({ data: traces, layout });
+      setGridData(grid);
     } catch (error) {
       console.error("Error updating visualization:", error);
     }
   };
 
+  const updateVisualization = () => {
+    if (!state || selectedVars.length !== 2) return;
+
+    const traces = buildPlotData(
+      gridData,
+      state,
+      selectedVars,
+      showTrajectories,
+      agentHistory,
+      functions[selectedFunction]?.name || selectedFunction,
+    );
+
+    const layout = buildPlotLayout(
+      functions[selectedFunction]?.name || selectedFunction,
+      selectedVars,
+      gridData.bounds,
+    );
+
+    setPlotData({ data: traces, layout });
+  };
+
   const handleVarCheckbox = (varIdx) => {
     if (selectedVars.includes(varIdx)) {
       setSelectedVars(selectedVars.filter((v) => v !== varIdx));
@@ -178,6 +196,8 @@ function App() {
             onStep={step}
             onStop={stop}
             onReset={reset}
+            throttle={throttle}
+            onThrottleChange={setThrottle}
           />
         </div>
 
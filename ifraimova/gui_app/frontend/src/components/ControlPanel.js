@@ -5,6 +5,8 @@ const ControlPanel = ({
   onStep,
   onStop,
   onReset,
+  throttle,
+  onThrottleChange,
 }) => {
   return (
     <div className="control-panel">
@@ -32,6 +34,17 @@ const ControlPanel = ({
       <button className="btn-control btn-reset" onClick={onReset}>
         🔄 Reset
       </button>
+      <label className="throttle-control">
+        Delay: {throttle} ms
+        <input
+          type="range"
+          min="0"
+          max="500"
+          step="10"
+          value={throttle}
+          onChange={(e) => onThrottleChange(Number(e.target.value))}
+        />
+      </label>
     </div>
   );
 };
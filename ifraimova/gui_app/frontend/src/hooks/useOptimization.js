@@ -1,16 +1,70 @@
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import * as api from "../services/api";
 
 export const useOptimization = () => {
   const [state, setState] = useState(null);
   const [isRunning, setIsRunning] = useState(false);
   const [agentHistory, setAgentHistory] = useState([]);
+  const [throttle, setThrottleState] = useState(0);
+
+  const streamRef = useRef(null);
+  const pendingRef = useRef([]);
+  const frameRef = useRef(null);
+
+  // States can arrive faster than the browser paints; render at most one
+  // per animation frame but keep every iteration in the trajectory history.
+  const flush = () => {
+    frameRef.current = null;
+    const batch = pendingRef.current;
+    pendingRef.current = [];
+    if (batch.length === 0) return;
+    setState(batch[batch.length - 1]);
+    setAgentHistory((prev) => [
+      ...prev,
+      ...batch.map((s) => s.agent_positions),
+    ]);
+  };
+
+  const closeStream = () => {
+    if (streamRef.current) {
+      streamRef.current.close();
+      streamRef.current = null;
+    }
+    if (frameRef.current !== null) {
+      cancelAnimationFrame(frameRef.current);
+      frameRef.current = null;
+    }
+    pendingRef.current = [];
+  };
+
+  const openStream = () => {
+    closeStream();
+    const source = api.openStream();
+    source.addEventListener("state", (event) => {
+      pendingRef.current.push(JSON.parse(event.data));
+      if (frameRef.current === null) {
+        frameRef.current = requestAnimationFrame(flush);
+      }
+    });
+    source.addEventListener("status", (event) => {
+      const { status, error } = JSON.parse(event.data);
+      setIsRunning(status === "running");
+      if (status === "error") {
+        console.error("Background run failed:", error);
+        alert(`Ошибка оптимизации: ${error}`);
+      }
+    });
+    streamRef.current = source;
+  };
 
   const initialize = async (params) => {
     try {
+      closeStream();
       const response = await api.initializeOptimization(params);
       setState(response.state);
       setAgentHistory([response.state.agent_positions]);
+      setIsRunning(false);
+      openStream();
       return { success: true };
     } catch (error) {
       console.error("Error initializing:", error);
@@ -37,16 +91,40 @@ export const useOptimization = () => {
     }
   };
 
-  const start = () => {
-    setIsRunning(true);
+  // Starts the background run, or resumes it after stop()
+  const start = async () => {
+    try {
+      await api.runOptimization(throttle / 1000);
+      setIsRunning(true);
+    } catch (error) {
+      console.error("Error starting:", error);
+    }
+  };
+
+  const stop = async () => {
+    try {
+      await api.pauseOptimization();
+      setIsRunning(false);
+    } catch (error) {
+      console.error("Error pausing:", error);
+    }
   };
 
-  const stop = () => {
-    setIsRunning(false);
+  // Minimum delay between iterations in milliseconds (0 = compute speed)
+  const setThrottle = async (ms) => {
+    setThrottleState(ms);
+    if (isRunning) {
+      try {
+        await api.throttleOptimization(ms / 1000);
+      } catch (error) {
+        console.error("Error throttling:", error);
+      }
+    }
   };
 
   const reset = async () => {
     try {
+      closeStream();
       await api.resetOptimization();
       setState(null);
       setAgentHistory([]);
@@ -58,25 +136,18 @@ export const useOptimization = () => {
     }
   };
 
-  useEffect(() => {
-    if (isRunning && state && !state.completed) {
-      const timer = setTimeout(() => {
-        step();
-      }, 100);
-      return () => clearTimeout(timer);
-    } else if (state?.completed) {
-      setIsRunning(false);
-    }
-  }, [isRunning, state]);
+  useEffect(() => closeStream, []);
 
   return {
     state,
     isRunning,
     agentHistory,
+    throttle,
     initialize,
     step,
     start,
     stop,
+    setThrottle,
     reset,
   };
 };
@@ -2,33 +2,79 @@ import axios from "axios";
 
 const API_URL = "http://localhost:5000/api";
 
+// The backend keeps one optimizer per session; the ID it returns from
+// /initialize is kept for this tab and sent with every request.
+const SESSION_KEY = "dolphinSessionId";
+
+const api = axios.create({ baseURL: API_URL });
+
+api.interceptors.request.use((config) => {
+  const sessionId = sessionStorage.getItem(SESSION_KEY);
+  if (sessionId) {
+    config.headers["X-Session-ID"] = sessionId;
+  }
+  return config;
+});
+
 export const getFunctions = async () => {
-  const response = await axios.get(`${API_URL}/functions`);
+  const response = await api.get("/functions");
   return response.data.functions;
 };
 
 export const initializeOptimization = async (params) => {
-  const response = await axios.post(`${API_URL}/initialize`, {
+  const response = await api.post("/initialize", {
     function: params.functionName,
     dimension: params.dimension,
     population_size: params.populationSize,
     max_iterations: params.maxIterations,
   });
+  sessionStorage.setItem(SESSION_KEY, response.data.session_id);
   return response.data;
 };
 
 export const stepOptimization = async () => {
-  const response = await axios.post(`${API_URL}/step`);
+  const response = await api.post("/step");
+  return response.data;
+};
+
+// Runs the remaining iterations on the backend; states arrive on the stream.
+// `delay` is the minimum time between iterations in seconds.
+export const runOptimization = async (delay = 0) => {
+  const response = await api.post("/run", { delay });
+  return response.data;
+};
+
+export const pauseOptimization = async () => {
+  const response = await api.post("/pause");
   return response.data;
 };
 
+export const resumeOptimization = async () => {
+  const response = await api.post("/resume");
+  return response.data;
+};
+
+export const throttleOptimization = async (delay) => {
+  const response = await api.post("/throttle", { delay });
+  return response.data;
+};
+
+// EventSource cannot send headers, so the session ID goes in the query.
+export const openStream = () => {
+  const sessionId = sessionStorage.getItem(SESSION_KEY);
+  return new EventSource(
+    `${API_URL}/stream?session_id=${encodeURIComponent(sessionId)}`,
+  );
+};
+
 export const resetOptimization = async () => {
-  const response = await axios.post(`${API_URL}/reset`);
+  const response = await api.post("/reset");
+  sessionStorage.removeItem(SESSION_KEY);
   return response.data;
 };
 
 export const evaluateGrid = async (params) => {
-  const response = await axios.post(`${API_URL}/evaluate_grid`, {
+  const response = await api.post("/evaluate_grid", {
     function: params.functionName,
     fixed_vars: params.fixedVars,
     var_indices: params.varIndices,
@@ -0,0 +1,206 @@
+"""
+Preallocated frame storage for optimizer histories.
+
+A FrameHistory holds equally shaped frames (for example the (N, D) position
+array of every iteration, or a scalar best fitness with frame_shape=()) in
+one (frames, *shape) array instead of a list of copies. It supports
+stride-based subsampling, a ring buffer that keeps only the last K frames,
+and a .npy memmap backend for runs that do not fit in memory. Indexing,
+len() and iteration behave like the list it replaces, so existing consumers
+keep working.
+
+flush() leaves an on-disk history holding exactly the stored frames, oldest
+first, and writes their iteration indices to <name>_iterations.npy next to
+it, so the file can be reloaded with np.load without the optimizer.
+"""
+
+import os
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class FrameHistory:
+
+    def __init__(self,
+                 max_frames: int,
+                 frame_shape: Tuple[int, ...],
+                 dtype=float,
+                 stride: int = 1,
+                 keep_last: Optional[int] = None,
+                 path: Optional[str] = None):
+        if stride < 1:
+            raise ValueError("stride must be at least 1")
+        if keep_last is not None and keep_last < 1:
+            raise ValueError("keep_last must be at least 1")
+
+        self.frame_shape = tuple(frame_shape)
+        self.stride = stride
+        self.keep_last = keep_last
+        self.path = path
+
+        # Every stride-th frame plus, via finalize(), the last one if skipped
+        capacity = -(-max_frames // stride) + (1 if (max_frames - 1) % stride else 0)
+        if keep_last is not None:
+            capacity = min(capacity, keep_last)
+        capacity = max(1, capacity)
+        shape = (capacity,) + self.frame_shape
+        if path is None:
+            self._frames = np.empty(shape, dtype=dtype)
+        else:
+            self._frames = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=shape)
+        self._iterations = np.empty(capacity, dtype=np.int64)
+
+        self._offered = 0
+        self._count = 0
+        self._head = 0
+        self._skipped = None
+
+    @property
+    def capacity(self) -> int:
+        return self._frames.shape[0]
+
+    @property
+    def offered(self) -> int:
+        """Number of frames appended so far, including the ones the stride skipped."""
+        return self._offered
+
+    @property
+    def iterations_path(self) -> Optional[str]:
+        """Where flush() saves the iteration index of an on-disk history."""
+        if self.path is None:
+            return None
+        return os.path.splitext(self.path)[0] + '_iterations.npy'
+
+    @property
+    def nbytes(self) -> int:
+        return self._frames.nbytes
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _physical(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("history index out of range")
+        return (self._head + index) % self.capacity
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_array()[index]
+        return self._frames[self._physical(index)]
+
+    def __array__(self, dtype=None, copy=None):
+        frames = self.to_array()
+        return frames if dtype is None else frames.astype(dtype, copy=False)
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self._frames[self._physical(i)]
+
+    @property
+    def frame_iterations(self) -> np.ndarray:
+        """Iteration index of every stored frame, oldest first."""
+        order = (self._head + np.arange(self._count)) % max(1, self.capacity)
+        return self._iterations[order]
+
+    def append(self, frame: np.ndarray):
+        iteration = self._offered
+        self._offered += 1
+        if iteration % self.stride != 0:
+            self._skipped = iteration
+            return
+        self._skipped = None
+        self._store(iteration, frame)
+
+    def finalize(self, frame: np.ndarray):
+        """
+        Store `frame` as the most recent iteration if the stride skipped it,
+        so that the last stored frame is always the final state of the run.
+        """
+        if self._skipped is not None:
+            self._store(self._skipped, frame)
+            self._skipped = None
+
+    def _store(self, iteration: int, frame: np.ndarray):
+        if self._count < self.capacity:
+            slot = (self._head + self._count) % self.capacity
+            self._count += 1
+        elif self.keep_last is not None and self.capacity >= self.keep_last:
+            slot = self._head
+            self._head = (self._head + 1) % self.capacity
+        else:
+            self._grow()
+            slot = self._count
+            self._count += 1
+        self._frames[slot] = frame
+        self._iterations[slot] = iteration
+
+    def _grow(self):
+        extra = max(1, self.capacity)
+        if self.keep_last is not None:
+            extra = min(extra, self.keep_last - self.capacity)
+        self._reallocate(self.capacity + extra)
+
+    def _reallocate(self, capacity: int):
+        """Move the stored frames, oldest first, into new storage of `capacity` frames."""
+        count, dtype = self._count, self._frames.dtype
+        shape = (capacity,) + self.frame_shape
+        iterations = np.empty(capacity, dtype=np.int64)
+        iterations[:count] = self.frame_iterations
+        if self.path is None:
+            frames = np.empty(shape, dtype=dtype)
+            frames[:count] = self.to_array()
+        else:
+            tmp_path = self.path + '.tmp'
+            frames = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=dtype, shape=shape)
+            for i, frame in enumerate(self):
+                frames[i] = frame
+            frames.flush()
+            # Release both mappings before the new file replaces the old one.
+            del frames
+            self._frames = None
+            os.replace(tmp_path, self.path)
+            frames = np.lib.format.open_memmap(self.path, mode='r+')
+        self._frames = frames
+        self._iterations = iterations
+        self._head = 0
+
+    def restore(self, frames: np.ndarray, iterations: np.ndarray, offered: int):
+        """
+        Replace the contents with `frames` (chronological, as returned by
+        to_array) after `offered` appends, e.g. when resuming a checkpoint.
+        """
+        self._head = 0
+        self._count = 0
+        while len(frames) > self.capacity and (self.keep_last is None
+                                               or self.capacity < self.keep_last):
+            self._grow()
+        frames, iterations = frames[-self.capacity:], iterations[-self.capacity:]
+        self._frames[:len(frames)] = frames
+        self._iterations[:len(frames)] = iterations
+        self._count = len(frames)
+        self._offered = offered
+        last = offered - 1
+        stored = len(iterations) and iterations[-1] == last
+        self._skipped = last if last % self.stride != 0 and not stored else None
+
+    def to_array(self) -> np.ndarray:
+        """Stored frames in chronological order; a view unless the ring has wrapped."""
+        if self._head == 0:
+            return self._frames[:self._count]
+        return np.roll(self._frames, -self._head, axis=0)[:self._count]
+
+    def flush(self):
+        """
+        Write an on-disk history out: trim the file to the stored frames in
+        chronological order and save their iterations to iterations_path.
+        """
+        if self.path is None:
+            return
+        if self._count and (self._head != 0 or self._count != self.capacity):
+            self._reallocate(self._count)
+        else:
+            self._frames.flush()
+        np.save(self.iterations_path, self.frame_iterations)
@@ -0,0 +1,226 @@
+"""
+Island model: several Dolphin Echolocation pods in separate processes.
+
+Every island is an independent DolphinEcholocation with its own RNG stream
+and best solution, driven through ask/tell inside a worker process. Every
+`migration_interval` iterations each island sends its `n_migrants` best
+dolphins to the coordinator, which routes them along the topology and sends
+each island its immigrants; these replace the island's worst dolphins.
+Only the migrants cross process boundaries, never whole populations.
+
+Migration epochs are synchronous, so a run is reproducible for a given seed
+regardless of scheduling. Between epochs the islands run fully in parallel.
+
+Topologies:
+    ring    island i receives the migrants of island i - 1
+    full    island i receives the best n_migrants of all other islands
+
+Each island gets its own deep copy of the extra optimizer arguments, so
+stateful objects such as StoppingCriteria or callbacks are never shared
+between islands, also not in thread mode.
+
+With the 'spawn' start method the objective function must be importable
+(defined at module level), as for any multiprocessing target.
+"""
+
+import copy
+import multiprocessing
+import threading
+import time
+import traceback
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from dolphin import DolphinEcholocation, SeedLike, spawn_rngs
+
+
+TOPOLOGIES = ('ring', 'full')
+
+
+def _best_rows(fitness: np.ndarray, count: int) -> np.ndarray:
+    return np.argsort(fitness, kind='stable')[:count]
+
+
+def _island_worker(conn, index: int, objective_function: Callable, dimension: int,
+                   bounds, seed, migration_interval: int, n_migrants: int,
+                   optimizer_kwargs: dict):
+    try:
+        de = DolphinEcholocation(objective_function, dimension, bounds, seed=seed,
+                                 verbose=False, **optimizer_kwargs)
+        reason = None
+        while reason is None:
+            reason = de.iterate()
+            epoch = de.iteration_count > 0 and de.iteration_count % migration_interval == 0
+            if reason is None and epoch:
+                best = _best_rows(de.fitness, n_migrants)
+                conn.send(('migrants', de.positions[best].copy(), de.fitness[best].copy()))
+                positions, fitness = conn.recv()
+                de.inject(positions, fitness)
+
+        conn.send(('done', {
+            'island': index,
+            'best_position': de.best_position,
+            'best_fitness': float(de.best_fitness),
+            'convergence_history': de.convergence_history.to_array().copy(),
+            'function_evaluations': de.function_evaluations,
+            'iterations': de.iteration_count,
+            'stop_reason': de.stop_reason
+        }))
+    except BaseException:
+        try:
+            conn.send(('error', traceback.format_exc()))
+        except OSError:
+            pass  # the coordinator has already gone away
+    finally:
+        conn.close()
+
+
+class IslandModel:
+
+    def __init__(self,
+                 objective_function: Callable,
+                 dimension: int,
+                 bounds: List[Tuple[float, float]],
+                 n_islands: int = 4,
+                 migration_interval: int = 10,
+                 n_migrants: int = 2,
+                 topology: str = 'ring',
+                 parallelism: str = 'process',
+                 seed: SeedLike = None,
+                 verbose: bool = True,
+                 **optimizer_kwargs):
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"topology must be one of {TOPOLOGIES}, got {topology!r}")
+        if parallelism not in ('process', 'thread'):
+            raise ValueError(f"parallelism must be 'process' or 'thread', got {parallelism!r}")
+        if migration_interval < 1:
+            raise ValueError("migration_interval must be at least 1")
+
+        self.objective_function = objective_function
+        self.dimension = dimension
+        self.bounds = bounds
+        self.n_islands = n_islands
+        self.migration_interval = migration_interval
+        self.n_migrants = n_migrants
+        self.topology = topology
+        self.parallelism = parallelism
+        self.verbose = verbose
+        self.optimizer_kwargs = optimizer_kwargs
+
+        self.island_rngs = spawn_rngs(seed, n_islands)
+
+        self.island_results: List[dict] = []
+        self.best_position = None
+        self.best_fitness = float('inf')
+        self.convergence_history = np.empty(0)
+        self.function_evaluations = 0
+        self.migrations = 0
+
+    def _route(self, emigrants: dict) -> dict:
+        """Immigrants for every island that took part in this epoch."""
+        islands = sorted(emigrants)
+        empty = (np.empty((0, self.dimension)), np.empty(0))
+        if len(islands) < 2:
+            return {island: empty for island in islands}
+
+        immigrants = {}
+        for position, island in enumerate(islands):
+            if self.topology == 'ring':
+                immigrants[island] = emigrants[islands[position - 1]]
+            else:
+                others = [emigrants[other] for other in islands if other != island]
+                positions = np.concatenate([p for p, _ in others])
+                fitness = np.concatenate([f for _, f in others])
+                best = _best_rows(fitness, self.n_migrants)
+                immigrants[island] = (positions[best], fitness[best])
+        return immigrants
+
+    def _start_workers(self) -> list:
+        if self.parallelism == 'process':
+            context = multiprocessing.get_context()
+            make_pipe, make_worker = context.Pipe, context.Process
+        else:
+            make_pipe, make_worker = multiprocessing.Pipe, threading.Thread
+
+        connections, workers = [], []
+        for index in range(self.n_islands):
+            parent, child = make_pipe()
+            worker = make_worker(target=_island_worker, daemon=True, args=(
+                child, index, self.objective_function, self.dimension, self.bounds,
+                self.island_rngs[index], self.migration_interval, self.n_migrants,
+                copy.deepcopy(self.optimizer_kwargs)))
+            worker.start()
+            if self.parallelism == 'process':
+                child.close()
+            connections.append(parent)
+            workers.append(worker)
+        return list(zip(connections, workers))
+
+    def optimize(self) -> Tuple[np.ndarray, float, np.ndarray]:
+        start_time = time.time()
+        if self.verbose:
+            print("=" * 70)
+            print(f"Island model: {self.n_islands} islands ({self.parallelism}), "
+                  f"{self.topology} topology")
+            print(f"Migration: {self.n_migrants} migrants every "
+                  f"{self.migration_interval} iterations")
+            print("-" * 70)
+
+        islands = self._start_workers()
+        active = set(range(self.n_islands))
+        results = {}
+        try:
+            while active:
+                emigrants = {}
+                for index in sorted(active):
+                    message = islands[index][0].recv()
+                    if message[0] == 'error':
+                        raise RuntimeError(f"island {index} failed:\n{message[1]}")
+                    if message[0] == 'done':
+                        results[index] = message[1]
+                        active.discard(index)
+                    else:
+                        emigrants[index] = (message[1], message[2])
+
+                if not emigrants:
+                    continue
+                self.migrations += 1
+                for index, payload in self._route(emigrants).items():
+                    islands[index][0].send(payload)
+                if self.verbose:
+                    best = min(float(np.min(f)) for _, f in emigrants.values())
+                    print(f"Migration {self.migrations:3d}: best = {best:.6e} "
+                          f"({len(emigrants)} active islands)")
+        finally:
+            for connection, worker in islands:
+                connection.close()
+                worker.join(timeout=5)
+
+        self.island_results = [results[index] for index in range(self.n_islands)]
+        winner = min(self.island_results, key=lambda r: r['best_fitness'])
+        self.best_position = winner['best_position']
+        self.best_fitness = winner['best_fitness']
+        self.function_evaluations = sum(r['function_evaluations'] for r in self.island_results)
+        self.convergence_history = self._combined_history()
+
+        if self.verbose:
+            print("-" * 70)
+            print(f"✓ Optimization completed in {time.time() - start_time:.2f} seconds")
+            print(f"✓ Total function evaluations: {self.function_evaluations}")
+            print(f"✓ Best island: {winner['island']}")
+            print(f"✓ Final best fitness: {self.best_fitness:.6e}")
+            print("=" * 70)
+
+        return self.best_position, self.best_fitness, self.convergence_history
+
+    def _combined_history(self) -> np.ndarray:
+        """Best fitness over all islands per iteration; finished islands keep their last value."""
+        histories = [r['convergence_history'] for r in self.island_results
+                     if len(r['convergence_history'])]
+        if not histories:
+            return np.empty(0)
+        length = max(len(h) for h in histories)
+        padded = np.array([np.pad(h, (0, length - len(h)), mode='edge') for h in histories])
+        return padded.min(axis=0)
+
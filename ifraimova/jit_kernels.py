@@ -0,0 +1,135 @@
+"""
+Numba-compiled population kernels, used by DolphinEcholocation(backend='numba').
+
+The NumPy kernels in kernels.py build (block, N, D) difference tensors and
+(N, D) temporaries for every term of the position update. Here each
+dolphin's row is a single loop over its neighbours or coordinates that is
+parallelized across cores with prange, so nothing larger than the output is
+allocated. Random numbers are still drawn by the optimizer's NumPy
+Generator, so both backends consume the same stream and agree to within
+floating-point rounding.
+
+Numba is optional: when it is not installed, resolve_backend('numba') warns
+and falls back to 'numpy'.
+"""
+
+import warnings
+
+import numpy as np
+
+from kernels import AF_EPSILON, DEFAULT_MEMORY_LIMIT
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+BACKENDS = ('numpy', 'numba')
+
+
+def resolve_backend(backend: str) -> str:
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}")
+    if backend == 'numba' and numba is None:
+        warnings.warn("backend='numba' requested but numba is not installed; "
+                      "using the NumPy kernels", RuntimeWarning, stacklevel=3)
+        return 'numpy'
+    return backend
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _af_rows(queries, positions, contribution, re):
+        n_queries, dimension = queries.shape
+        af = np.empty(n_queries, dtype=queries.dtype)
+        inv_re = 1 / re
+        for i in numba.prange(n_queries):
+            total = 0.0
+            for j in range(positions.shape[0]):
+                squared = 0.0
+                for k in range(dimension):
+                    delta = queries[i, k] - positions[j, k]
+                    squared += delta * delta
+                distance = np.sqrt(squared)
+                if distance < re:
+                    total += inv_re * (re - distance) * contribution[j]
+            af[i] = total + AF_EPSILON
+        return af
+
+    @numba.njit(parallel=True, cache=True)
+    def _close_count(positions, reference, radius):
+        n, dimension = positions.shape
+        count = 0
+        for i in numba.prange(n):
+            squared = 0.0
+            for k in range(dimension):
+                delta = positions[i, k] - reference[k]
+                squared += delta * delta
+            if np.sqrt(squared) < radius:
+                count += 1
+        return count
+
+    @numba.njit(parallel=True, cache=True)
+    def _move_pod(positions, start, best, direction, scale, neighbors, pp, social_weight,
+                  lower, upper, out):
+        n, dimension = direction.shape
+        for i in numba.prange(n):
+            neighbor = neighbors[i]
+            for k in range(dimension):
+                x = positions[start + i, k]
+                value = (x + pp * (best[k] - x) + scale[i] * direction[i, k]
+                         + social_weight * (positions[neighbor, k] - x))
+                out[i, k] = min(max(value, lower[k]), upper[k])
+
+    @numba.njit(cache=True)
+    def _move_dolphin(position, best, direction, scale, neighbor, pp, social_weight,
+                      lower, upper):
+        for k in range(position.shape[0]):
+            x = position[k]
+            value = (x + pp * (best[k] - x) + scale * direction[k]
+                     + social_weight * (neighbor[k] - x))
+            position[k] = min(max(value, lower[k]), upper[k])
+
+
+def accumulative_fitness(positions: np.ndarray,
+                         fitness: np.ndarray,
+                         re: float,
+                         memory_limit: int = DEFAULT_MEMORY_LIMIT,
+                         rows=None) -> np.ndarray:
+    queries = positions if rows is None else positions[rows]
+    if re <= 0:
+        return np.full(queries.shape[0], AF_EPSILON, dtype=positions.dtype)
+    contribution = (1.0 / (1.0 + fitness)).astype(positions.dtype, copy=False)
+    return _af_rows(queries, positions, contribution, float(re))
+
+
+def population_geometry(positions: np.ndarray,
+                        fitness: np.ndarray,
+                        re: float,
+                        reference: np.ndarray,
+                        reference_radius: float,
+                        memory_limit: int = DEFAULT_MEMORY_LIMIT):
+    af = accumulative_fitness(positions, fitness, re)
+    return af, int(_close_count(positions, reference, float(reference_radius)))
+
+
+def move_pod(positions: np.ndarray, start: int, best: np.ndarray, direction: np.ndarray,
+             scale: np.ndarray, neighbors: np.ndarray, pp: float, social_weight: float,
+             lower: np.ndarray, upper: np.ndarray, out: np.ndarray):
+    """
+    Clipped synchronous update of the rows start:start + len(direction);
+    `scale` is the per-dolphin factor (1 - pp) * AF * Re of the random
+    direction. `out` must not alias `positions`, since the social term reads
+    the neighbours' old rows.
+    """
+    _move_pod(positions, start, best, direction, scale, neighbors, pp, social_weight,
+              lower, upper, out)
+
+
+def move_dolphin(position: np.ndarray, best: np.ndarray, direction: np.ndarray,
+                 scale: float, neighbor: np.ndarray, pp: float, social_weight: float,
+                 lower: np.ndarray, upper: np.ndarray):
+    """In-place clipped update of a single row (the per-dolphin/asynchronous path)."""
+    _move_dolphin(position, best, direction, scale, neighbor, pp, social_weight, lower, upper)
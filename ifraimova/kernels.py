@@ -0,0 +1,127 @@
+"""
+Vectorized population kernels for the Dolphin Echolocation algorithm.
+Pairwise distances are computed in row blocks so that peak memory stays
+below a configurable limit instead of materializing a full N x N x D tensor.
+All temporaries follow the dtype of `positions` (float64 or float32).
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+
+
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+AF_EPSILON = 1e-10
+
+
+def block_rows(n_rows: int, n_points: int, dimension: int,
+               memory_limit: int = DEFAULT_MEMORY_LIMIT,
+               itemsize: int = 8) -> int:
+    bytes_per_row = n_points * (dimension + 3) * itemsize
+    return int(max(1, min(n_rows, memory_limit // max(1, bytes_per_row))))
+
+
+def sample_columns(rng: np.random.Generator, n_rows: int, n_columns: int, k: int) -> np.ndarray:
+    """k distinct column indices per row, uniform over the k-subsets.
+    
+    For k << n_columns, k integers are drawn per row and only duplicates
+    are redrawn, which is O(k) per row instead of O(n_columns).
+    """
+    if 8 * k > n_columns:
+        keys = rng.random((n_rows, n_columns), dtype=np.float32)
+        return np.argpartition(keys, k - 1, axis=1)[:, :k]
+    
+    cols = rng.integers(0, n_columns, (n_rows, k))
+    while True:
+        cols.sort(axis=1)
+        duplicate = np.zeros(cols.shape, dtype=bool)
+        duplicate[:, 1:] = cols[:, 1:] == cols[:, :-1]
+        count = np.count_nonzero(duplicate)
+        if count == 0:
+            return cols
+        cols[duplicate] = rng.integers(0, n_columns, count)
+
+
+def _iter_distance_blocks(positions: np.ndarray, points: np.ndarray, memory_limit: int):
+    n_rows = positions.shape[0]
+    rows = block_rows(n_rows, points.shape[0], positions.shape[1],
+                      memory_limit, positions.itemsize)
+    for start in range(0, n_rows, rows):
+        stop = min(start + rows, n_rows)
+        diff = positions[start:stop, None, :] - points[None, :, :]
+        yield start, stop, np.sqrt(np.einsum('ijk,ijk->ij', diff, diff))
+
+
+def _influence_sum(distances: np.ndarray, contribution: np.ndarray, re: float) -> np.ndarray:
+    influence = np.where(distances < re, (1 / re) * (re - distances), 0.0)
+    return influence @ contribution
+
+
+def accumulative_fitness(positions: np.ndarray,
+                         fitness: np.ndarray,
+                         re: float,
+                         memory_limit: int = DEFAULT_MEMORY_LIMIT,
+                         rows: Optional[np.ndarray] = None) -> np.ndarray:
+    queries = positions if rows is None else positions[rows]
+    af = np.zeros(queries.shape[0], dtype=positions.dtype)
+    if re > 0:
+        contribution = (1.0 / (1.0 + fitness)).astype(positions.dtype, copy=False)
+        for start, stop, distances in _iter_distance_blocks(queries, positions, memory_limit):
+            af[start:stop] = _influence_sum(distances, contribution, re)
+    return af + AF_EPSILON
+
+
+def population_geometry(positions: np.ndarray,
+                        fitness: np.ndarray,
+                        re: float,
+                        reference: np.ndarray,
+                        reference_radius: float,
+                        memory_limit: int = DEFAULT_MEMORY_LIMIT) -> Tuple[np.ndarray, int]:
+    """
+    Single pass over the pairwise distance blocks that yields both the
+    accumulative fitness for radius `re` and the number of dolphins closer
+    than `reference_radius` to `reference` (used by the convergence factor).
+    """
+    n = positions.shape[0]
+    af = np.zeros(n, dtype=positions.dtype)
+    reference = reference.astype(positions.dtype, copy=False)
+    if re <= 0:
+        distances = np.linalg.norm(positions - reference, axis=1)
+        return af + AF_EPSILON, int(np.count_nonzero(distances < reference_radius))
+    
+    points = np.vstack([positions, reference[None, :]])
+    close_count = 0
+    contribution = (1.0 / (1.0 + fitness)).astype(positions.dtype, copy=False)
+    for start, stop, distances in _iter_distance_blocks(positions, points, memory_limit):
+        af[start:stop] = _influence_sum(distances[:, :n], contribution, re)
+        close_count += int(np.count_nonzero(distances[:, n] < reference_radius))
+    return af + AF_EPSILON, close_count
+
+
+def batched_accumulative_fitness(positions: np.ndarray,
+                                 fitness: np.ndarray,
+                                 re: float,
+                                 memory_limit: int = DEFAULT_MEMORY_LIMIT) -> np.ndarray:
+    """
+    AF for K independent swarms at once: `positions` is (K, N, D) and
+    `fitness` is (K, N). Squared distances come from the Gram expansion
+    |a|^2 + |b|^2 - 2 a.b, which avoids the (K, N, N, D) difference tensor;
+    swarms are processed in blocks that respect `memory_limit`.
+    """
+    n_swarms, n, dimension = positions.shape
+    af = np.zeros((n_swarms, n))
+    if re > 0:
+        contribution = 1.0 / (1.0 + fitness)
+        squared_norms = np.einsum('kid,kid->ki', positions, positions)
+        swarms = block_rows(n_swarms, n, n, memory_limit, positions.itemsize)
+        for start in range(0, n_swarms, swarms):
+            stop = min(start + swarms, n_swarms)
+            block = positions[start:stop]
+            squared = block @ block.transpose(0, 2, 1)
+            squared *= -2
+            squared += squared_norms[start:stop, :, None]
+            squared += squared_norms[start:stop, None, :]
+            np.maximum(squared, 0.0, out=squared)
+            distances = np.sqrt(squared, out=squared)
+            influence = np.where(distances < re, (1 / re) * (re - distances), 0.0)
+            af[start:stop] = np.einsum('kij,kj->ki', influence, contribution[start:stop])
+    return af + AF_EPSILON
@@ -0,0 +1,159 @@
+"""
+Multi-seed statistical runner for the Dolphin Echolocation algorithm.
+
+Every (function, dimension, seed) combination is an independent run that
+is fanned out over a process pool. Each run gets its own RNG stream derived
+from a root SeedSequence, so the aggregated table is identical for any
+number of workers.
+
+Usage:
+    python multi_seed.py --functions sphere rastrigin --dims 10 30 --seeds 30 --workers 8
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from dolphin import (DolphinEcholocation, sphere_function, rastrigin_function,
+                     rosenbrock_function, ackley_function)
+
+
+BENCHMARKS = {
+    'sphere': {'function': sphere_function, 'bounds': (-100, 100)},
+    'rastrigin': {'function': rastrigin_function, 'bounds': (-5.12, 5.12)},
+    'rosenbrock': {'function': rosenbrock_function, 'bounds': (-5, 10)},
+    'ackley': {'function': ackley_function, 'bounds': (-32, 32)},
+}
+
+
+def make_tasks(functions: List[str], dimensions: List[int], n_seeds: int,
+               root_seed: int = 0, population_size: int = 30,
+               max_iterations: int = 100, target: float = 1e-6) -> List[dict]:
+    tasks = []
+    for config_index, (function_name, dimension) in enumerate(
+            (f, d) for f in functions for d in dimensions):
+        for run in range(n_seeds):
+            seed_sequence = np.random.SeedSequence([root_seed, config_index, run])
+            tasks.append({
+                'function': function_name,
+                'dimension': dimension,
+                'run': run,
+                'seed': int(seed_sequence.generate_state(1)[0]),
+                'population_size': population_size,
+                'max_iterations': max_iterations,
+                'target': target
+            })
+    return tasks
+
+
+def run_single(task: dict) -> dict:
+    benchmark = BENCHMARKS[task['function']]
+
+    de = DolphinEcholocation(
+        objective_function=benchmark['function'],
+        dimension=task['dimension'],
+        bounds=[benchmark['bounds']] * task['dimension'],
+        population_size=task['population_size'],
+        max_iterations=task['max_iterations'],
+        seed=task['seed'],
+        verbose=False
+    )
+    _, best_fitness, history = de.optimize()
+
+    reached = np.flatnonzero(np.asarray(history) <= task['target'])
+    evaluations_to_target = None
+    if len(reached):
+        evaluations_to_target = int((reached[0] + 1) * task['population_size'])
+
+    return {
+        'function': task['function'],
+        'dimension': task['dimension'],
+        'run': task['run'],
+        'seed': task['seed'],
+        'best_fitness': float(best_fitness),
+        'function_evaluations': de.function_evaluations,
+        'evaluations_to_target': evaluations_to_target
+    }
+
+
+def run_all(tasks: List[dict], workers: Optional[int] = None) -> List[dict]:
+    if workers == 1:
+        return [run_single(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_single, tasks, chunksize=1))
+
+
+def aggregate(results: List[dict], target: float) -> List[Dict]:
+    groups = {}
+    for result in sorted(results, key=lambda r: (r['function'], r['dimension'], r['run'])):
+        groups.setdefault((result['function'], result['dimension']), []).append(result)
+
+    rows = []
+    for (function_name, dimension), runs in groups.items():
+        fitness = np.array([r['best_fitness'] for r in runs])
+        hits = [r['evaluations_to_target'] for r in runs if r['evaluations_to_target'] is not None]
+        rows.append({
+            'function': function_name,
+            'dimension': dimension,
+            'runs': len(runs),
+            'mean': float(np.mean(fitness)),
+            'median': float(np.median(fitness)),
+            'std': float(np.std(fitness)),
+            'best': float(np.min(fitness)),
+            'worst': float(np.max(fitness)),
+            'success_rate': len(hits) / len(runs),
+            'mean_evaluations_to_target': float(np.mean(hits)) if hits else None,
+            'target': target
+        })
+    return rows
+
+
+def format_table(rows: List[Dict]) -> str:
+    lines = [
+        f"{'Function':<12} {'Dim':>5} {'Runs':>5} {'Mean':>12} {'Median':>12} {'Std':>12} "
+        f"{'Best':>12} {'Worst':>12} {'Success':>8} {'Evals→target':>13}",
+        "-" * 112
+    ]
+    for row in rows:
+        to_target = row['mean_evaluations_to_target']
+        lines.append(
+            f"{row['function']:<12} {row['dimension']:>5} {row['runs']:>5} "
+            f"{row['mean']:>12.4e} {row['median']:>12.4e} {row['std']:>12.4e} "
+            f"{row['best']:>12.4e} {row['worst']:>12.4e} {row['success_rate']:>7.0%} "
+            f"{'-' if to_target is None else f'{to_target:.0f}':>13}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-seed statistical runner")
+    parser.add_argument('--functions', nargs='+', default=list(BENCHMARKS), choices=list(BENCHMARKS))
+    parser.add_argument('--dims', type=int, nargs='+', default=[10])
+    parser.add_argument('--seeds', type=int, default=30)
+    parser.add_argument('--root-seed', type=int, default=0)
+    parser.add_argument('--population', type=int, default=30)
+    parser.add_argument('--iterations', type=int, default=100)
+    parser.add_argument('--target', type=float, default=1e-6)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--output', type=str, default=None,
+                        help='Optional JSON file for the aggregated table and per-run results')
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.functions, args.dims, args.seeds, args.root_seed,
+                       args.population, args.iterations, args.target)
+    results = run_all(tasks, args.workers)
+    rows = aggregate(results, args.target)
+
+    print(format_table(rows))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'summary': rows, 'runs': results}, f, indent=2)
+        print(f"\nResults saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
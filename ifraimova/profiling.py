@@ -0,0 +1,152 @@
+"""
+Opt-in per-phase timing for the Dolphin Echolocation optimization loop.
+
+Phases recorded by DolphinEcholocation(profile=True):
+    accumulative_fitness   calculate_accumulative_fitness (near zero when the
+                           value was already produced by the geometry pass)
+    position_update        drawing and applying the moves (one call per
+                           update block)
+    evaluation             objective evaluation (one call per update block)
+    geometry               combined pass producing the convergence factor and
+                           the next iteration's AF (only with convergence_curve)
+    history                recording convergence/PP/CF/position histories
+
+Stats are available as a structured object and can be exported as a
+Chrome trace (chrome://tracing, Perfetto) or a speedscope profile.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List
+
+import numpy as np
+
+
+_NULL_PHASE = nullcontext()
+
+
+class PhaseStats:
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.total = 0.0
+        self.per_iteration: List[float] = []
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            'calls': self.calls,
+            'total': self.total,
+            'mean': self.mean,
+            'per_iteration': list(self.per_iteration)
+        }
+
+
+class PhaseProfiler:
+
+    def __init__(self):
+        self.phases: Dict[str, PhaseStats] = {}
+        self.events = []
+        self._origin = time.perf_counter()
+        self._iteration_totals: Dict[str, float] = {}
+        self._iteration_start = None
+        self.iterations = 0
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            stats = self.phases.get(name)
+            if stats is None:
+                stats = self.phases[name] = PhaseStats(name)
+                stats.per_iteration = [0.0] * self.iterations
+            stats.calls += 1
+            stats.total += end - start
+            self._iteration_totals[name] = self._iteration_totals.get(name, 0.0) + end - start
+            self.events.append((name, start - self._origin, end - start))
+
+    def begin_iteration(self):
+        self._iteration_totals = {}
+        self._iteration_start = time.perf_counter()
+
+    def end_iteration(self):
+        end = time.perf_counter()
+        for name, stats in self.phases.items():
+            stats.per_iteration.append(self._iteration_totals.get(name, 0.0))
+        self.events.append(('iteration', self._iteration_start - self._origin,
+                            end - self._iteration_start))
+        self.iterations += 1
+
+    def stats(self) -> Dict[str, dict]:
+        return {name: stats.as_dict() for name, stats in self.phases.items()}
+
+    def summary(self) -> str:
+        grand_total = sum(stats.total for stats in self.phases.values()) or 1.0
+        lines = [f"{'Phase':<22} {'Calls':>7} {'Total (s)':>11} {'Mean (ms)':>11} {'Share':>7}",
+                 "-" * 62]
+        for stats in sorted(self.phases.values(), key=lambda s: -s.total):
+            lines.append(f"{stats.name:<22} {stats.calls:>7} {stats.total:>11.4f} "
+                         f"{stats.mean * 1e3:>11.3f} {stats.total / grand_total:>6.1%}")
+        return "\n".join(lines)
+
+    def per_iteration_array(self, name: str) -> np.ndarray:
+        return np.asarray(self.phases[name].per_iteration)
+
+    def export_chrome_trace(self, path: str):
+        trace = [{
+            'name': name,
+            'cat': 'dolphin',
+            'ph': 'X',
+            'ts': start * 1e6,
+            'dur': duration * 1e6,
+            'pid': os.getpid(),
+            'tid': 0
+        } for name, start, duration in self.events]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f)
+
+    def export_speedscope(self, path: str, name: str = 'Dolphin Echolocation'):
+        frame_names = sorted({event[0] for event in self.events})
+        frame_index = {frame: i for i, frame in enumerate(frame_names)}
+
+        # Iterations enclose their phases; open the outer span first when
+        # two spans start at the same instant.
+        spans = sorted(self.events, key=lambda e: (e[1], e[0] != 'iteration'))
+        events, open_spans = [], []
+        for frame, start, duration in spans:
+            while open_spans and open_spans[-1][1] <= start:
+                closing, end = open_spans.pop()
+                events.append({'type': 'C', 'frame': frame_index[closing], 'at': end})
+            events.append({'type': 'O', 'frame': frame_index[frame], 'at': start})
+            open_spans.append((frame, start + duration))
+        while open_spans:
+            closing, end = open_spans.pop()
+            events.append({'type': 'C', 'frame': frame_index[closing], 'at': end})
+
+        document = {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'shared': {'frames': [{'name': frame} for frame in frame_names]},
+            'profiles': [{
+                'type': 'evented',
+                'name': name,
+                'unit': 'seconds',
+                'startValue': events[0]['at'] if events else 0.0,
+                'endValue': events[-1]['at'] if events else 0.0,
+                'events': events
+            }]
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(document, f)
+
+
+def phase(profiler, name: str):
+    return profiler.phase(name) if profiler is not None else _NULL_PHASE
@@ -0,0 +1,178 @@
+"""
+Spatial indexes answering fixed-radius neighbour queries for the
+accumulative-fitness step. The index is rebuilt from scratch for every
+iteration, so the cost of AF follows the number of dolphins actually
+inside the effective radius instead of N^2.
+"""
+
+import itertools
+import numpy as np
+from typing import Iterator, Tuple
+
+from kernels import AF_EPSILON, DEFAULT_MEMORY_LIMIT
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+
+NEIGHBOR_SEARCH_METHODS = ('brute', 'grid', 'kdtree')
+
+PairChunk = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class GridIndex:
+    """
+    Uniform grid hash with cell size equal to the query radius.
+
+    Only the `max_dims` coordinates with the widest spread are hashed, so
+    the number of neighbouring cells stays at 3^max_dims in any dimension.
+    Projection never increases distances, hence the cells adjacent to a
+    dolphin's cell always contain all of its true neighbours; the exact
+    full-dimensional distance check removes the extra candidates.
+    """
+
+    def __init__(self, positions: np.ndarray, radius: float, max_dims: int = 3):
+        self.positions = positions
+        self.radius = radius
+
+        spread = positions.max(axis=0) - positions.min(axis=0)
+        dims = np.argsort(spread)[::-1][:max_dims]
+        cells_per_dim = np.floor(spread[dims] / radius).astype(np.int64) + 3
+        while len(dims) > 1 and np.prod(cells_per_dim.astype(float)) >= 2.0 ** 62:
+            dims, cells_per_dim = dims[:-1], cells_per_dim[:-1]
+        self.dims = dims
+
+        projected = positions[:, dims]
+        cells = np.floor((projected - projected.min(axis=0)) / radius).astype(np.int64) + 1
+        strides = np.cumprod(np.concatenate([[1], cells_per_dim[:-1]]))
+        self.strides = strides
+
+        keys = cells @ strides
+        self.order = np.argsort(keys, kind='stable')
+        self.cell_keys, self.cell_starts, self.cell_counts = np.unique(
+            keys[self.order], return_index=True, return_counts=True)
+
+    def query_pairs(self, memory_limit: int = DEFAULT_MEMORY_LIMIT) -> Iterator[PairChunk]:
+        dimension = self.positions.shape[1]
+        max_pairs = max(1, memory_limit // ((dimension + 4) * 8))
+
+        for offset in itertools.product((-1, 0, 1), repeat=len(self.dims)):
+            neighbor_keys = self.cell_keys + np.dot(offset, self.strides)
+            slot = np.searchsorted(self.cell_keys, neighbor_keys)
+            slot = np.minimum(slot, len(self.cell_keys) - 1)
+            matched = np.flatnonzero(self.cell_keys[slot] == neighbor_keys)
+            if len(matched) == 0:
+                continue
+
+            cells_a = matched
+            cells_b = slot[matched]
+            sizes = self.cell_counts[cells_a] * self.cell_counts[cells_b]
+
+            start = 0
+            while start < len(cells_a):
+                cumulative = np.cumsum(sizes[start:])
+                stop = start + max(1, int(np.searchsorted(cumulative, max_pairs, side='right')))
+                yield self._candidate_pairs(cells_a[start:stop], cells_b[start:stop])
+                start = stop
+
+    def _candidate_pairs(self, cells_a: np.ndarray, cells_b: np.ndarray) -> PairChunk:
+        count_a = self.cell_counts[cells_a]
+        count_b = self.cell_counts[cells_b]
+        sizes = count_a * count_b
+
+        pair_cell = np.repeat(np.arange(len(cells_a)), sizes)
+        first = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        local = np.arange(int(sizes.sum())) - first[pair_cell]
+
+        i = self.order[self.cell_starts[cells_a][pair_cell] + local // count_b[pair_cell]]
+        j = self.order[self.cell_starts[cells_b][pair_cell] + local % count_b[pair_cell]]
+
+        diff = self.positions[i] - self.positions[j]
+        distances = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+        inside = distances < self.radius
+        return i[inside], j[inside], distances[inside]
+
+
+class KDTreeIndex:
+
+    def __init__(self, positions: np.ndarray, radius: float):
+        if cKDTree is None:
+            raise ImportError("neighbor_search='kdtree' requires scipy (pip install scipy)")
+        self.positions = positions
+        self.radius = radius
+        self.tree = cKDTree(positions)
+
+    def query_pairs(self, memory_limit: int = DEFAULT_MEMORY_LIMIT) -> Iterator[PairChunk]:
+        n, dimension = self.positions.shape
+        max_pairs = max(1, memory_limit // ((dimension + 4) * 8))
+        if n * n <= max_pairs:
+            yield from self._all_pairs()
+            return
+
+        # Rows are queried in the tree's leaf order, so a block covers a
+        # compact region. Neighbour counts come first, so each block is cut
+        # at max_pairs directed pairs (every row includes itself) before any
+        # neighbour list is built.
+        order = self.tree.indices
+        queries = self.positions[order]
+        counts = self.tree.query_ball_point(queries, self.radius, return_length=True)
+        cumulative = np.cumsum(counts)
+
+        start = 0
+        while start < n:
+            done = cumulative[start - 1] if start else 0
+            stop = max(start + 1, int(np.searchsorted(cumulative, done + max_pairs, side='right')))
+            neighbors = self.tree.query_ball_point(queries[start:stop], self.radius,
+                                                   return_sorted=False)
+            sizes = counts[start:stop]
+            i = np.repeat(order[start:stop], sizes)
+            j = np.fromiter(itertools.chain.from_iterable(neighbors), dtype=np.intp,
+                            count=int(sizes.sum()))
+            yield self._inside(i, j)
+            start = stop
+
+    def _all_pairs(self) -> Iterator[PairChunk]:
+        # Even N^2 directed pairs fit the memory limit: one query suffices.
+        n = self.positions.shape[0]
+        pairs = self.tree.query_pairs(self.radius, output_type='ndarray')
+        i, j, distances = self._inside(pairs[:, 0], pairs[:, 1])
+
+        self_idx = np.arange(n)
+        yield self_idx, self_idx, np.zeros(n)
+        yield i, j, distances
+        yield j, i, distances
+
+    def _inside(self, i: np.ndarray, j: np.ndarray) -> PairChunk:
+        diff = self.positions[i] - self.positions[j]
+        distances = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+        inside = distances < self.radius
+        return i[inside], j[inside], distances[inside]
+
+
+def build_index(method: str, positions: np.ndarray, radius: float):
+    if method == 'grid':
+        return GridIndex(positions, radius)
+    if method == 'kdtree':
+        return KDTreeIndex(positions, radius)
+    raise ValueError(f"Unknown neighbor search method: {method!r}. "
+                     f"Expected one of {NEIGHBOR_SEARCH_METHODS}")
+
+
+def indexed_accumulative_fitness(positions: np.ndarray,
+                                 fitness: np.ndarray,
+                                 re: float,
+                                 method: str = 'grid',
+                                 memory_limit: int = DEFAULT_MEMORY_LIMIT) -> np.ndarray:
+    n = positions.shape[0]
+    af = np.zeros(n, dtype=positions.dtype)
+    if re <= 0:
+        return af + AF_EPSILON
+
+    contribution = (1.0 / (1.0 + fitness)).astype(positions.dtype, copy=False)
+    index = build_index(method, positions, re)
+    for i, j, distances in index.query_pairs(memory_limit):
+        influence = (1 / re) * (re - distances)
+        af += np.bincount(i, weights=influence * contribution[j], minlength=n)
+    return af + AF_EPSILON
@@ -0,0 +1,84 @@
+"""
+Early-termination criteria for the Dolphin Echolocation algorithm.
+Criteria are checked once per iteration; the first one that fires is
+recorded as the optimizer's `stop_reason`.
+"""
+
+from collections import deque
+from typing import Optional
+
+
+MAX_ITERATIONS = 'max_iterations'
+TARGET_FITNESS = 'target_fitness'
+STAGNATION = 'stagnation'
+CONVERGENCE_FACTOR = 'convergence_factor'
+MAX_EVALUATIONS = 'max_evaluations'
+MAX_TIME = 'max_time'
+
+
+class StoppingCriteria:
+    """
+    target_fitness       stop once best_fitness <= target_fitness
+    stagnation_window    stop when the relative improvement of best_fitness over
+    stagnation_tolerance the last `stagnation_window` iterations is below the tolerance
+    cf_threshold         stop when the convergence factor (%) reaches this value
+    max_evaluations      stop once function_evaluations >= max_evaluations
+                         (checked per iteration, so it may overshoot by up to N)
+    max_time             wall-clock limit in seconds
+    """
+
+    def __init__(self,
+                 target_fitness: Optional[float] = None,
+                 stagnation_window: Optional[int] = None,
+                 stagnation_tolerance: float = 1e-8,
+                 cf_threshold: Optional[float] = None,
+                 max_evaluations: Optional[int] = None,
+                 max_time: Optional[float] = None):
+        self.target_fitness = target_fitness
+        self.stagnation_window = stagnation_window
+        self.stagnation_tolerance = stagnation_tolerance
+        self.cf_threshold = cf_threshold
+        self.max_evaluations = max_evaluations
+        self.max_time = max_time
+        self.reset()
+
+    def reset(self):
+        window = self.stagnation_window + 1 if self.stagnation_window else 1
+        self._recent_best = deque(maxlen=window)
+
+    @property
+    def recent_best(self) -> list:
+        return list(self._recent_best)
+    
+    def restore(self, recent_best):
+        self.reset()
+        self._recent_best.extend(float(value) for value in recent_best)
+    
+    def check(self, optimizer, elapsed: float) -> Optional[str]:
+        best = optimizer.best_fitness
+        self._recent_best.append(best)
+
+        if self.target_fitness is not None and best <= self.target_fitness:
+            return TARGET_FITNESS
+
+        if self.max_evaluations is not None and optimizer.function_evaluations >= self.max_evaluations:
+            return MAX_EVALUATIONS
+
+        if self.max_time is not None and elapsed >= self.max_time:
+            return MAX_TIME
+
+        if self.stagnation_window and len(self._recent_best) == self._recent_best.maxlen:
+            oldest = self._recent_best[0]
+            improvement = (oldest - best) / max(abs(oldest), 1e-300)
+            if improvement < self.stagnation_tolerance:
+                return STAGNATION
+
+        if self.cf_threshold is not None:
+            if optimizer.convergence_curve and optimizer.cf_history:
+                cf = optimizer.cf_history[-1]
+            else:
+                cf = optimizer.calculate_convergence_factor()
+            if cf >= self.cf_threshold:
+                return CONVERGENCE_FACTOR
+
+        return None
@@ -0,0 +1,92 @@
+"""
+Tests for the ask/tell protocol of DolphinEcholocation
+"""
+
+import numpy as np
+import pytest
+from dolphin import DolphinEcholocation, batch_objective, sphere_function
+
+
+def make_optimizer(objective_function=sphere_function, **kwargs) -> DolphinEcholocation:
+    return DolphinEcholocation(objective_function, dimension=3, bounds=[(-5, 5)] * 3,
+                               population_size=6, max_iterations=5, seed=0,
+                               verbose=False, **kwargs)
+
+
+def test_tell_before_first_ask_is_rejected():
+    de = make_optimizer()
+    
+    with pytest.raises(RuntimeError):
+        de.tell(np.zeros(de.population_size))
+    
+    assert de.function_evaluations == 0
+    assert de.best_position is None
+    
+    candidates = de.ask()
+    assert de.tell(sphere_function(candidates)) is None
+    assert de.function_evaluations == de.population_size
+
+
+@pytest.mark.parametrize('update_block', [1, None])
+def test_second_tell_for_one_ask_is_rejected(update_block):
+    de = make_optimizer(update_block=update_block)
+    candidates = de.ask()
+    de.tell(sphere_function(candidates))
+    
+    with pytest.raises(RuntimeError):
+        de.tell(sphere_function(candidates))
+    
+    candidates = de.ask()
+    de.tell(sphere_function(candidates))
+    evaluations = de.function_evaluations
+    
+    with pytest.raises(RuntimeError):
+        de.tell(sphere_function(candidates))
+    assert de.function_evaluations == evaluations
+
+
+def test_ask_tell_matches_optimize():
+    reference = make_optimizer(update_block=4)
+    reference.optimize()
+    
+    de = make_optimizer(update_block=4)
+    reason = None
+    while reason is None:
+        reason = de.tell(sphere_function(de.ask()))
+    
+    assert de.best_fitness == reference.best_fitness
+    assert de.function_evaluations == reference.function_evaluations
+
+
+def recording_objective(sizes: list, concurrent: bool = False):
+    @batch_objective
+    def objective(x):
+        sizes.append(len(x))
+        return sphere_function(x)
+    objective.concurrent = concurrent
+    return objective
+
+
+@pytest.mark.parametrize('update_block, expected', [(None, 6), (4, 4), (1, 1)])
+def test_ask_returns_blocks_of_update_block_rows(update_block, expected):
+    de = make_optimizer(update_block=update_block)
+    de.tell(sphere_function(de.ask()))
+    
+    assert de.ask().shape == (expected, 3)
+
+
+def test_in_process_optimize_moves_one_dolphin_at_a_time():
+    sizes = []
+    make_optimizer(recording_objective(sizes)).optimize()
+    
+    assert sizes[0] == 6
+    assert set(sizes[1:]) == {1}
+
+
+def test_concurrent_evaluation_gets_the_whole_pod():
+    sizes = []
+    make_optimizer(recording_objective(sizes, concurrent=True)).optimize()
+    assert set(sizes) == {6}
+    
+    with pytest.warns(RuntimeWarning):
+        make_optimizer(update_block=1).optimize(executor='thread', max_workers=2)
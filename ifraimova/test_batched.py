@@ -0,0 +1,70 @@
+"""
+Tests for BatchedDolphinEcholocation
+"""
+
+import numpy as np
+import pytest
+from batched import BatchedDolphinEcholocation
+from dolphin import batch_objective, sphere_function
+
+
+def make_batched(objective_function=sphere_function, dimension=3, **kwargs):
+    kwargs.setdefault('n_swarms', 4)
+    kwargs.setdefault('population_size', 6)
+    kwargs.setdefault('max_iterations', 10)
+    return BatchedDolphinEcholocation(objective_function, dimension=dimension,
+                                      bounds=[(-5, 5)] * dimension, seed=0,
+                                      verbose=False, **kwargs)
+
+
+@batch_objective
+def sphere_with_holes(x):
+    values = np.sum(x ** 2, axis=-1)
+    values[x[:, 0] > 2] = np.nan
+    return values
+
+
+def test_nan_fitness_keeps_positions_finite():
+    optimizer = make_batched(sphere_with_holes, n_swarms=8)
+    _, best_fitness, _ = optimizer.optimize()
+
+    assert np.all(np.isfinite(optimizer.positions))
+    assert np.all(np.isfinite(best_fitness))
+
+
+def test_normalize_af_falls_back_to_uniform_per_swarm():
+    optimizer = make_batched(n_swarms=3, population_size=4)
+    af_values = np.array([[1.0, 1.0, 2.0, 0.0],
+                          [np.nan, 1.0, 1.0, 1.0],
+                          [0.0, 0.0, 0.0, 0.0]])
+
+    af_normalized = optimizer.normalize_af(af_values)
+
+    np.testing.assert_allclose(af_normalized[0], [0.25, 0.25, 0.5, 0.0])
+    np.testing.assert_allclose(af_normalized[1:], 0.25)
+
+
+@pytest.mark.parametrize('update_block, expected', [(None, 6), (2, 3), (6, 1)])
+def test_objective_is_called_once_per_block(update_block, expected):
+    sizes = []
+
+    @batch_objective
+    def recording(x):
+        sizes.append(len(x))
+        return np.sum(x ** 2, axis=-1)
+
+    optimizer = make_batched(recording, update_block=update_block, max_iterations=1)
+    optimizer.optimize()
+
+    # One initial whole-pod call, then one call per block of every swarm.
+    assert sizes[0] == 4 * 6
+    assert len(sizes) == 1 + expected
+    assert set(sizes[1:]) == {4 * 6 // expected}
+
+
+def test_block_update_converges_like_a_single_swarm():
+    optimizer = make_batched(dimension=10, n_swarms=20, population_size=30,
+                             max_iterations=100)
+    _, best_fitness, _ = optimizer.optimize()
+
+    assert np.mean(best_fitness < 1e-4) >= 0.8
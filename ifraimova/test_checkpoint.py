@@ -0,0 +1,80 @@
+"""
+Tests for checkpoint and resume of DolphinEcholocation
+"""
+
+import os
+
+import numpy as np
+import pytest
+import checkpoint
+from dolphin import DolphinEcholocation, sphere_function
+
+
+def make_optimizer(**kwargs) -> DolphinEcholocation:
+    return DolphinEcholocation(sphere_function, dimension=3, bounds=[(-5, 5)] * 3,
+                               population_size=6, max_iterations=10, seed=0,
+                               verbose=False, cache=64, **kwargs)
+
+
+def test_resume_matches_an_uninterrupted_run(tmp_path):
+    path = str(tmp_path / 'run.npz')
+    reference = make_optimizer()
+    reference.optimize()
+
+    # Checkpoints are written after iterations 4 and 8; the file holds 8.
+    make_optimizer(checkpoint_path=path, checkpoint_every=4).optimize()
+
+    resumed = make_optimizer()
+    resumed.load_checkpoint(path)
+    assert resumed.iteration_count == 8
+    resumed.optimize()
+
+    np.testing.assert_array_equal(resumed.positions, reference.positions)
+    np.testing.assert_array_equal(resumed.best_position, reference.best_position)
+    assert resumed.best_fitness == reference.best_fitness
+    assert resumed.function_evaluations == reference.function_evaluations
+    np.testing.assert_array_equal(resumed.convergence_history.to_array(),
+                                  reference.convergence_history.to_array())
+    assert resumed.cache.hits == reference.cache.hits
+    assert resumed.cache.misses == reference.cache.misses
+
+
+def test_failed_write_keeps_the_previous_checkpoint(tmp_path, monkeypatch):
+    path = str(tmp_path / 'run.npz')
+    de = make_optimizer(checkpoint_path=path)
+    de.optimize()
+    de.save_checkpoint()
+    with open(path, 'rb') as f:
+        previous = f.read()
+
+    def failing_savez(f, **arrays):
+        f.write(b'partial')
+        raise OSError("disk full")
+
+    monkeypatch.setattr(checkpoint.np, 'savez', failing_savez)
+    with pytest.raises(OSError):
+        de.save_checkpoint()
+
+    with open(path, 'rb') as f:
+        assert f.read() == previous
+    assert os.listdir(tmp_path) == ['run.npz']
+
+
+def test_checkpoint_is_refused_inside_an_iteration(tmp_path):
+    path = str(tmp_path / 'run.npz')
+    de = make_optimizer(update_block=2)
+
+    with pytest.raises(RuntimeError):
+        de.save_checkpoint(path)
+
+    candidates = de.ask()
+    de.tell(sphere_function(candidates))
+    candidates = de.ask()
+    with pytest.raises(RuntimeError):
+        de.save_checkpoint(path)
+
+    # The first block is told, the rest of the iteration is still pending.
+    de.tell(sphere_function(candidates))
+    with pytest.raises(RuntimeError):
+        de.save_checkpoint(path)
+    assert not os.path.exists(path)
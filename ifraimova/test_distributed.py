@@ -0,0 +1,79 @@
+"""
+Tests for the distributed evaluation coordinator
+"""
+
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from distributed import (READY, TASK, EvaluationCoordinator, WorkersUnavailable,
+                         recv_message, run_worker, send_message)
+from dolphin import sphere_function
+from evaluation import EvaluationError
+
+
+def start_worker(address, objective_function=sphere_function) -> threading.Thread:
+    worker = threading.Thread(target=run_worker, args=(address, objective_function, 0.05),
+                              daemon=True)
+    worker.start()
+    return worker
+
+
+def take_task(address) -> socket.socket:
+    """Connect like a worker and receive one chunk without answering it."""
+    sock = socket.create_connection(address)
+    send_message(sock, READY)
+    kind, _, _ = recv_message(sock)
+    assert kind == TASK
+    return sock
+
+
+@pytest.mark.parametrize('dies_by', ['disconnect', 'silence'])
+def test_chunk_of_a_lost_worker_is_requeued(dies_by):
+    positions = np.arange(12, dtype=float).reshape(6, 2)
+    with EvaluationCoordinator(chunksize=2, heartbeat_timeout=0.2) as coordinator, \
+            ThreadPoolExecutor(1) as pool:
+        future = pool.submit(coordinator.evaluate, positions)
+        lost = take_task(coordinator.address)
+        if dies_by == 'disconnect':
+            lost.close()
+
+        start_worker(coordinator.address)
+        fitness = future.result(timeout=10)
+        lost.close()
+
+    np.testing.assert_array_equal(fitness, np.sum(positions ** 2, axis=1))
+    assert coordinator.requeued == 1
+    assert coordinator.evaluations == 6
+
+
+def test_close_fails_pending_batches():
+    coordinator = EvaluationCoordinator(worker_timeout=None)
+    with ThreadPoolExecutor(1) as pool:
+        future = pool.submit(coordinator.evaluate, np.zeros((3, 2)))
+        with coordinator._condition:
+            coordinator._condition.wait_for(lambda: coordinator._pending, timeout=5)
+        coordinator.close()
+
+        with pytest.raises(WorkersUnavailable):
+            future.result(timeout=5)
+
+
+def test_evaluate_gives_up_when_no_worker_connects():
+    with EvaluationCoordinator(worker_timeout=0.2) as coordinator:
+        with pytest.raises(WorkersUnavailable):
+            coordinator.evaluate(np.zeros((3, 2)))
+        assert not coordinator._pending
+        assert not coordinator._queue
+
+
+def test_objective_error_fails_the_batch():
+    def failing(x):
+        raise ValueError("undefined here")
+
+    with EvaluationCoordinator(chunksize=2) as coordinator:
+        start_worker(coordinator.address, failing)
+        with pytest.raises(EvaluationError, match="undefined here"):
+            coordinator.evaluate(np.zeros((4, 2)))
@@ -0,0 +1,68 @@
+"""
+Tests for the evaluation cache
+"""
+
+import numpy as np
+from dolphin import DolphinEcholocation, batch_objective
+from evaluation import EvaluationCache
+
+
+def test_cache_counts_hits_misses_and_evictions():
+    cache = EvaluationCache(maxsize=2)
+    a, b, c = (cache.key(np.full(2, value)) for value in (1.0, 2.0, 3.0))
+
+    assert cache.get(a) is None
+    cache.put(a, 1.0)
+    cache.put(b, 2.0)
+    assert cache.get(a) == 1.0
+    cache.put(c, 3.0)
+
+    # a was used more recently than b, so b is the one evicted.
+    assert cache.get(b) is None
+    assert cache.get(a) == 1.0
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 2, 1)
+    assert len(cache) == 2
+
+
+def test_lookup_evaluates_repeated_rows_once():
+    cache = EvaluationCache()
+    cache.put(cache.key(np.zeros(2)), 0.0)
+    positions = np.array([[0.0, 0.0], [1.0, 1.0], [1.0, 1.0]])
+
+    fitness, keys, missing, cached = cache.lookup(positions)
+
+    np.testing.assert_array_equal(missing, [1])
+    np.testing.assert_array_equal(cached, [True, False, False])
+    assert fitness[0] == 0.0
+    assert keys[1] == keys[2]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_tolerance_shares_one_entry_for_near_duplicates():
+    cache = EvaluationCache(tolerance=1e-3)
+    assert cache.key(np.array([0.5, 0.5])) == cache.key(np.array([0.5001, 0.4999]))
+    assert cache.key(np.array([0.5, 0.5])) != cache.key(np.array([0.502, 0.5]))
+
+
+def test_cached_nan_is_a_hit_next_to_a_miss():
+    calls = []
+
+    @batch_objective
+    def undefined_in_a_corner(x):
+        calls.append(len(x))
+        values = np.sum(x ** 2, axis=-1)
+        values[x[:, 0] >= 5] = np.nan
+        return values
+
+    de = DolphinEcholocation(undefined_in_a_corner, dimension=2, bounds=[(-5, 5)] * 2,
+                             population_size=4, max_iterations=2, seed=0,
+                             verbose=False, cache=16)
+    corner = np.array([[5.0, 5.0]])
+    assert np.isnan(de.evaluate_positions(corner)[0])
+
+    fitness = de.evaluate_positions(np.array([[5.0, 5.0], [1.0, 2.0]]))
+
+    assert np.isnan(fitness[0])
+    assert fitness[1] == 5.0
+    assert calls == [1, 1]
+    assert (de.cache.hits, de.cache.misses) == (1, 2)
@@ -5,19 +5,21 @@ Demonstrates the algorithm on various benchmark optimization problems
 
 import numpy as np
 import matplotlib.pyplot as plt
-from dolphin import DolphinEcholocation, sphere_function, rastrigin_function, rosenbrock_function, ackley_function
+from dolphin import DolphinEcholocation, batch_objective, sphere_function, rastrigin_function, rosenbrock_function, ackley_function
 import time
 
 
+@batch_objective
 def griewank_function(x: np.ndarray) -> float:
-    sum_part = np.sum(x**2) / 4000
-    prod_part = np.prod(np.cos(x / np.sqrt(np.arange(1, len(x) + 1))))
+    sum_part = np.sum(x**2, axis=-1) / 4000
+    prod_part = np.prod(np.cos(x / np.sqrt(np.arange(1, x.shape[-1] + 1))), axis=-1)
     return sum_part - prod_part + 1
 
 
+@batch_objective
 def schwefel_function(x: np.ndarray) -> float:
-    n = len(x)
-    return 418.9829 * n - np.sum(x * np.sin(np.sqrt(np.abs(x))))
+    n = x.shape[-1]
+    return 418.9829 * n - np.sum(x * np.sin(np.sqrt(np.abs(x))), axis=-1)
 
 
 def run_test_example(name: str, 
@@ -0,0 +1,70 @@
+"""
+Tests for FrameHistory and the on-disk position history
+"""
+
+import numpy as np
+import pytest
+from dolphin import DolphinEcholocation, sphere_function
+from history import FrameHistory
+from stopping import StoppingCriteria
+
+
+def fill(history: FrameHistory, frames: int):
+    for iteration in range(frames):
+        history.append(np.full(2, iteration))
+
+
+@pytest.mark.parametrize('frames, expected', [(10, [0, 3, 6, 9]), (11, [0, 3, 6, 9, 10])])
+def test_stride_keeps_every_nth_frame_and_the_last(frames, expected):
+    history = FrameHistory(frames, (2,), stride=3)
+    fill(history, frames)
+    history.finalize(np.full(2, frames - 1))
+
+    assert history.capacity == len(expected)
+    np.testing.assert_array_equal(history.frame_iterations, expected)
+    np.testing.assert_array_equal(history.to_array()[:, 0], expected)
+
+
+def test_keep_last_is_a_ring_in_chronological_order():
+    history = FrameHistory(10, (2,), keep_last=3)
+    fill(history, 7)
+
+    assert history.capacity == 3
+    np.testing.assert_array_equal(history.frame_iterations, [4, 5, 6])
+    np.testing.assert_array_equal(history.to_array()[:, 0], [4, 5, 6])
+    np.testing.assert_array_equal(history[-1], [6, 6])
+
+
+def make_optimizer(path, **kwargs) -> DolphinEcholocation:
+    return DolphinEcholocation(sphere_function, dimension=3, bounds=[(-5, 5)] * 3,
+                               population_size=4, max_iterations=10, seed=0,
+                               verbose=False, track_positions=True,
+                               history_path=str(path), **kwargs)
+
+
+@pytest.mark.parametrize('kwargs, expected', [
+    ({}, list(range(11))),
+    ({'history_stride': 4}, [0, 4, 8, 10]),
+    ({'history_keep_last': 3}, [8, 9, 10]),
+])
+def test_on_disk_history_holds_exactly_the_stored_frames(tmp_path, kwargs, expected):
+    path = tmp_path / 'positions.npy'
+    de = make_optimizer(path, **kwargs)
+    de.optimize()
+
+    frames = np.load(path)
+    assert frames.shape == (len(expected), 4, 3)
+    np.testing.assert_array_equal(frames[-1], de.positions)
+    np.testing.assert_array_equal(np.load(tmp_path / 'positions_iterations.npy'), expected)
+
+
+def test_on_disk_history_is_trimmed_after_an_early_stop(tmp_path):
+    path = tmp_path / 'positions.npy'
+    de = make_optimizer(path, stopping=StoppingCriteria(max_evaluations=4 * 4))
+    de.optimize()
+
+    frames = np.load(path)
+    assert len(frames) == de.iteration_count + 1 < 11
+    np.testing.assert_array_equal(frames[-1], de.positions)
+    np.testing.assert_array_equal(np.load(tmp_path / 'positions_iterations.npy'),
+                                  np.arange(de.iteration_count + 1))
@@ -116,23 +116,29 @@ class DEOVisualizer2D:
             print("История позиций не сохранена")
             return
         
+        # With a stride or a ring buffer, frame k is not iteration k.
+        recorded = de_algorithm.position_history.frame_iterations
         if iterations_to_show is None:
             total = len(de_algorithm.position_history)
-            iterations_to_show = [0, total//5, 2*total//5, 3*total//5, 4*total//5, total-1]
+            frames = [0, total//5, 2*total//5, 3*total//5, 4*total//5, total-1]
+        else:
+            # Latest recorded frame at or before each requested iteration
+            frames = np.maximum(np.searchsorted(recorded, iterations_to_show, side='right') - 1, 0)
         
-        n_plots = len(iterations_to_show)
+        n_plots = len(frames)
         fig, axes = plt.subplots(2, 3, figsize=(18, 12))
         axes = axes.flatten()
         
         X, Y, Z = self.create_contour_plot()
         
-        for idx, iteration in enumerate(iterations_to_show):
+        for idx, frame in enumerate(frames):
             ax = axes[idx]
+            iteration = int(recorded[frame])
             
             contour = ax.contourf(X, Y, Z, levels=50, cmap='viridis', alpha=0.6)
             ax.contour(X, Y, Z, levels=20, colors='black', alpha=0.2, linewidths=0.5)
             
-            positions = de_algorithm.position_history[iteration]
+            positions = de_algorithm.position_history[frame]
             
             fitnesses = []
             for pos in positions:
@@ -210,6 +216,8 @@ class DEOVisualizer2D:
         ax.set_ylabel('Y', fontsize=12)
         ax.grid(True, alpha=0.3)
         
+        recorded = de_algorithm.position_history.frame_iterations
+        
         def init():
             scatter.set_offsets(np.empty((0, 2)))
             best_scatter.set_offsets(np.empty((0, 2)))
@@ -223,8 +231,9 @@ class DEOVisualizer2D:
             best_idx = np.argmin(fitnesses)
             best_scatter.set_offsets(positions[best_idx:best_idx+1])
             
-            pp = de_algorithm.calculate_pp(frame)
-            title.set_text(f'Итерация {frame}/{len(de_algorithm.position_history)-1} | '
+            iteration = int(recorded[frame])
+            pp = de_algorithm.calculate_pp(iteration)
+            title.set_text(f'Итерация {iteration}/{recorded[-1]} | '
                           f'PP = {pp:.3f} | Best f = {fitnesses[best_idx]:.4f}')
             
             return scatter, best_scatter, title